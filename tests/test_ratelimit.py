@@ -0,0 +1,68 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import unittest
+
+from twitchio.ratelimit import RateLimitBucket
+
+
+class RateLimitBucketTests(unittest.IsolatedAsyncioTestCase):
+    async def test_release_without_headers_returns_point(self) -> None:
+        bucket: RateLimitBucket = RateLimitBucket("test", limit=3)
+
+        # Connection errors, timeouts and cancellations release without response headers...
+        for _ in range(3):
+            await bucket.acquire()
+            bucket.release(None)
+
+        await asyncio.wait_for(bucket.acquire(), timeout=1.0)
+        self.assertEqual(bucket.inflight, 1)
+
+    async def test_release_without_headers_wakes_waiter(self) -> None:
+        bucket: RateLimitBucket = RateLimitBucket("test", limit=1)
+        await bucket.acquire()
+
+        waiter: asyncio.Task[None] = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        bucket.release(None)
+        await asyncio.wait_for(waiter, timeout=0.5)
+
+    async def test_release_with_headers_uses_reported_state(self) -> None:
+        bucket: RateLimitBucket = RateLimitBucket("test", limit=3)
+        await bucket.acquire()
+
+        reset: float = time.time() + 60
+        bucket.release({"Ratelimit-Limit": "800", "Ratelimit-Remaining": "10", "Ratelimit-Reset": str(reset)})
+
+        self.assertEqual((bucket.limit, bucket.remaining, bucket.reset), (800, 10, reset))
+
+
+if __name__ == "__main__":
+    unittest.main()
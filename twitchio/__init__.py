@@ -37,9 +37,12 @@ from . import (  # noqa: F401
 )
 from .assets import Asset as Asset
 from .authentication import Scopes as Scopes
+from .breaker import CircuitBreaker as CircuitBreaker, CircuitBreakers as CircuitBreakers, CircuitState as CircuitState
+from .cache import CacheStats as CacheStats, ResponseCache as ResponseCache
 from .client import Client as Client
 from .exceptions import *
 from .http import HTTPAsyncIterator as HTTPAsyncIterator, Route as Route
+from .metrics import HTTPMetrics as HTTPMetrics, RequestMetrics as RequestMetrics, RouteStats as RouteStats
 from .models import *
 from .payloads import *
 from .user import *
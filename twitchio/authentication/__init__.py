@@ -25,4 +25,9 @@ SOFTWARE.
 from .oauth import OAuth as OAuth
 from .payloads import *
 from .scopes import Scopes as Scopes
+from .store import (
+    JSONTokenStore as JSONTokenStore,
+    SQLiteTokenStore as SQLiteTokenStore,
+    TokenStore as TokenStore,
+)
 from .tokens import ManagedHTTPClient as ManagedHTTPClient
@@ -36,6 +36,8 @@ from .payloads import *
 if TYPE_CHECKING:
     import aiohttp
 
+    from ..cache import ResponseCache
+    from ..types_.options import CircuitBreakerPolicy, ConnectionPolicy, HedgePolicy
     from ..types_.responses import (
         AuthorizationURLResponse,
         ClientCredentialsResponse,
@@ -57,8 +59,21 @@ class OAuth(HTTPClient):
         redirect_uri: str | None = None,
         scopes: Scopes | None = None,
         session: aiohttp.ClientSession = MISSING,
+        cache: ResponseCache | None = None,
+        connection_policy: ConnectionPolicy | None = None,
+        timeout: float | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        hedging: HedgePolicy | None = None,
     ) -> None:
-        super().__init__(session=session, client_id=client_id)
+        super().__init__(
+            session=session,
+            client_id=client_id,
+            cache=cache,
+            connection_policy=connection_policy,
+            timeout=timeout,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+        )
 
         self.client_id = client_id
         self.client_secret = client_secret
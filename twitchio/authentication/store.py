@@ -0,0 +1,342 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import contextlib
+import logging
+import os
+import pathlib
+import sqlite3
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ..utils import _from_json, _to_json  # type: ignore
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..types_.tokens import TokenMapping, TokenMappingData
+
+
+__all__ = ("JSONTokenStore", "SQLiteTokenStore", "TokenStore")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TokenStore(abc.ABC):
+    """Base class for storing the tokens managed by a :class:`~twitchio.Client` between restarts.
+
+    Once tokens have been loaded from a store, each change is written to it as it happens. A refreshed token is written
+    with :meth:`upsert`, and a removed token is deleted with :meth:`delete`. Every token is also written with :meth:`sync`
+    when the client is closed.
+
+    Subclass this to keep tokens somewhere else, such as your own database, and pass an instance to the ``token_store``
+    keyword-argument of :class:`~twitchio.Client`. Methods must not block the event loop.
+    """
+
+    @abc.abstractmethod
+    async def load(self) -> TokenMapping:
+        """|coro|
+
+        Return every stored user token, keyed by User-ID.
+        """
+
+    @abc.abstractmethod
+    async def get(self, user_id: str, /) -> TokenMappingData | None:
+        """|coro|
+
+        Return the stored token for a User-ID, or ``None`` if there is no token stored for them.
+        """
+
+    @abc.abstractmethod
+    async def upsert(self, data: TokenMappingData, /) -> None:
+        """|coro|
+
+        Add or replace the stored token for ``data["user_id"]``.
+        """
+
+    @abc.abstractmethod
+    async def delete(self, user_id: str, /) -> None:
+        """|coro|
+
+        Remove the stored token for a User-ID. Does nothing if there is no token stored for them.
+        """
+
+    async def sync(self, tokens: TokenMapping, app_token: str | None, /) -> None:
+        """|coro|
+
+        Make the store hold exactly ``tokens`` and ``app_token``. The default implementation removes tokens which are not
+        in ``tokens`` and calls :meth:`upsert` for every token. Backends which can write in bulk should override this.
+        """
+        for user_id in (await self.load()).keys() - tokens.keys():
+            await self.delete(user_id)
+
+        for data in tokens.values():
+            await self.upsert(data)
+
+        await self.set_app_token(app_token)
+
+    async def get_app_token(self) -> str | None:
+        """|coro|
+
+        Return the stored app token, or ``None``. The default implementation does not store the app token.
+        """
+        return None
+
+    async def set_app_token(self, token: str | None, /) -> None:
+        """|coro|
+
+        Store the app token, or remove it when ``token`` is ``None``. The default implementation does nothing.
+        """
+        return None
+
+
+class JSONTokenStore(TokenStore):
+    """A :class:`TokenStore` which keeps tokens in a JSON file. This is the default store.
+
+    The file is read and written in a thread so the event loop is never blocked. Each write replaces the file atomically
+    by writing to a temporary file and renaming it, so a crash can never leave a partially written file. Changes made
+    while a write is in progress are combined into the next write.
+
+    The file uses the same format as previous versions of TwitchIO. The app token is stored under the ``"app"`` key.
+
+    Parameters
+    ----------
+    path: str
+        The path of the JSON file. Defaults to ``".tio.tokens.json"``.
+    """
+
+    APP_KEY: ClassVar[str] = "app"
+
+    __slots__ = ("_data", "_lock", "_version", "_written", "path")
+
+    def __init__(self, path: str = ".tio.tokens.json") -> None:
+        self.path: str = path
+
+        self._data: dict[str, Any] | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._version: int = 0
+        self._written: int = 0
+
+    def __repr__(self) -> str:
+        return f"JSONTokenStore(path={self.path!r})"
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with open(self.path, "rb") as fp:
+                return _from_json(fp.read())
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, payload: bytes) -> None:
+        temp: pathlib.Path = pathlib.Path(f"{self.path}.tmp")
+
+        with temp.open("wb") as fp:
+            fp.write(payload)
+            fp.flush()
+            os.fsync(fp.fileno())
+
+        temp.replace(self.path)
+
+    async def _ensure(self) -> dict[str, Any]:
+        if self._data is None:
+            async with self._lock:
+                if self._data is None:
+                    self._data = await asyncio.to_thread(self._read)
+
+        return self._data
+
+    async def _commit(self) -> None:
+        self._version += 1
+        version: int = self._version
+
+        async with self._lock:
+            # A write which started after this change was made already contains it...
+            if self._written >= version:
+                return
+
+            current: int = self._version
+            await asyncio.to_thread(self._write, _to_json(self._data))
+            self._written = current
+
+    async def load(self) -> TokenMapping:
+        data: dict[str, Any] = await self._ensure()
+        return {k: v for k, v in data.items() if k != self.APP_KEY}
+
+    async def get(self, user_id: str, /) -> TokenMappingData | None:
+        return (await self.load()).get(user_id)
+
+    async def upsert(self, data: TokenMappingData, /) -> None:
+        (await self._ensure())[data["user_id"]] = dict(data)
+        await self._commit()
+
+    async def delete(self, user_id: str, /) -> None:
+        if (await self._ensure()).pop(user_id, None) is not None:
+            await self._commit()
+
+    async def sync(self, tokens: TokenMapping, app_token: str | None, /) -> None:
+        self._data = {k: dict(v) for k, v in tokens.items()}
+
+        if app_token:
+            # Stored in the shape of a user token so older versions load it as an app token...
+            self._data[self.APP_KEY] = {"user_id": "", "token": app_token, "refresh": "", "last_validated": ""}
+
+        await self._commit()
+
+    async def get_app_token(self) -> str | None:
+        app: dict[str, Any] | None = (await self._ensure()).get(self.APP_KEY)
+        return app.get("token") if app else None
+
+    async def set_app_token(self, token: str | None, /) -> None:
+        data: dict[str, Any] = await self._ensure()
+
+        if token:
+            data[self.APP_KEY] = {"user_id": "", "token": token, "refresh": "", "last_validated": ""}
+        elif data.pop(self.APP_KEY, None) is None:
+            return
+
+        await self._commit()
+
+
+class SQLiteTokenStore(TokenStore):
+    """A :class:`TokenStore` which keeps tokens in a SQLite database.
+
+    Each change only writes the row for the token that changed. Queries run in a thread so the event loop is never blocked.
+
+    Parameters
+    ----------
+    path: str
+        The path of the database file. Defaults to ``".tio.tokens.sqlite"``.
+    """
+
+    SCHEMA: ClassVar[str] = """
+        CREATE TABLE IF NOT EXISTS tokens (
+            user_id TEXT PRIMARY KEY,
+            token TEXT NOT NULL,
+            refresh TEXT NOT NULL,
+            last_validated TEXT NOT NULL,
+            expires_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS app_token (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            token TEXT NOT NULL
+        );
+    """
+
+    UPSERT: ClassVar[str] = """
+        INSERT INTO tokens (user_id, token, refresh, last_validated, expires_at) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (user_id) DO UPDATE SET
+            token = excluded.token,
+            refresh = excluded.refresh,
+            last_validated = excluded.last_validated,
+            expires_at = excluded.expires_at
+    """
+
+    __slots__ = ("_initialised", "_lock", "path")
+
+    def __init__(self, path: str = ".tio.tokens.sqlite") -> None:
+        self.path: str = path
+
+        self._initialised: bool = False
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"SQLiteTokenStore(path={self.path!r})"
+
+    @staticmethod
+    def _row(data: TokenMappingData) -> tuple[str, str, str, str, str | None]:
+        return data["user_id"], data["token"], data["refresh"], data["last_validated"], data.get("expires_at")
+
+    def _call(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        with contextlib.closing(sqlite3.connect(self.path)) as conn:
+            if not self._initialised:
+                conn.executescript(self.SCHEMA)
+                self._initialised = True
+
+            # The connection commits on success and rolls back on error...
+            with conn:
+                return func(conn)
+
+    async def _run(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        async with self._lock:
+            return await asyncio.to_thread(self._call, func)
+
+    async def load(self) -> TokenMapping:
+        query: str = "SELECT user_id, token, refresh, last_validated, expires_at FROM tokens"
+        rows: list[tuple[str, str, str, str, str | None]] = await self._run(lambda c: c.execute(query).fetchall())
+
+        return {
+            r[0]: {"user_id": r[0], "token": r[1], "refresh": r[2], "last_validated": r[3], "expires_at": r[4]} for r in rows
+        }
+
+    async def get(self, user_id: str, /) -> TokenMappingData | None:
+        query: str = "SELECT user_id, token, refresh, last_validated, expires_at FROM tokens WHERE user_id = ?"
+        row: tuple[str, str, str, str, str | None] | None = await self._run(
+            lambda c: c.execute(query, (user_id,)).fetchone()
+        )
+
+        if row is None:
+            return None
+
+        return {"user_id": row[0], "token": row[1], "refresh": row[2], "last_validated": row[3], "expires_at": row[4]}
+
+    async def upsert(self, data: TokenMappingData, /) -> None:
+        row: tuple[str, str, str, str, str | None] = self._row(data)
+        await self._run(lambda c: c.execute(self.UPSERT, row))
+
+    async def delete(self, user_id: str, /) -> None:
+        await self._run(lambda c: c.execute("DELETE FROM tokens WHERE user_id = ?", (user_id,)))
+
+    async def sync(self, tokens: TokenMapping, app_token: str | None, /) -> None:
+        rows: list[tuple[str, str, str, str, str | None]] = [self._row(d) for d in tokens.values()]
+
+        def replace(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM tokens")
+            conn.executemany(self.UPSERT, rows)
+            conn.execute("DELETE FROM app_token")
+
+            if app_token:
+                conn.execute("INSERT INTO app_token (id, token) VALUES (1, ?)", (app_token,))
+
+        await self._run(replace)
+
+    async def get_app_token(self) -> str | None:
+        row: tuple[str] | None = await self._run(lambda c: c.execute("SELECT token FROM app_token WHERE id = 1").fetchone())
+        return row[0] if row else None
+
+    async def set_app_token(self, token: str | None, /) -> None:
+        def update(conn: sqlite3.Connection) -> None:
+            if token:
+                conn.execute(
+                    "INSERT INTO app_token (id, token) VALUES (1, ?) ON CONFLICT (id) DO UPDATE SET token = ?",
+                    (token, token),
+                )
+            else:
+                conn.execute("DELETE FROM app_token")
+
+        await self._run(update)
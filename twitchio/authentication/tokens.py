@@ -24,9 +24,12 @@ SOFTWARE.
 
 import asyncio
 import datetime
-import json
+import functools
+import heapq
 import logging
-from typing import TYPE_CHECKING, Any, TypeVar
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 import aiohttp
 
@@ -34,13 +37,16 @@ from twitchio.http import Route
 from twitchio.types_.responses import RawResponse
 
 from ..backoff import Backoff
+from ..cache import ResponseCache
 from ..exceptions import HTTPException, InvalidTokenException
 from ..http import HTTPAsyncIterator, PaginatedConverter
+from ..types_.options import CircuitBreakerPolicy, ConnectionPolicy, HedgePolicy, TokenValidationPolicy
 from ..types_.tokens import TokenMappingData
 from ..utils import MISSING
 from .oauth import OAuth
 from .payloads import ClientCredentialsPayload, ValidateTokenPayload
 from .scopes import Scopes
+from .store import JSONTokenStore, TokenStore
 
 
 if TYPE_CHECKING:
@@ -54,7 +60,18 @@ logger: logging.Logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+DEFAULT_TOKEN_VALIDATION: TokenValidationPolicy = {
+    "concurrency": 10,
+    "fast_start": False,
+    "progress": None,
+}
+
+
 class ManagedHTTPClient(OAuth):
+    # Twitch requires tokens to be validated hourly. Tokens are refreshed this many seconds before they expire...
+    VALIDATE_INTERVAL: ClassVar[float] = 3600
+    REFRESH_MARGIN: ClassVar[float] = 300
+
     def __init__(
         self,
         *,
@@ -64,6 +81,13 @@ class ManagedHTTPClient(OAuth):
         scopes: Scopes | None = None,
         session: aiohttp.ClientSession = MISSING,
         nested_key: str | None = None,
+        cache: ResponseCache | None = None,
+        connection_policy: ConnectionPolicy | None = None,
+        timeout: float | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        hedging: HedgePolicy | None = None,
+        token_validation: TokenValidationPolicy | None = None,
+        token_store: TokenStore | None = None,
     ) -> None:
         super().__init__(
             client_id=client_id,
@@ -71,6 +95,11 @@ class ManagedHTTPClient(OAuth):
             redirect_uri=redirect_uri,
             scopes=scopes,
             session=session,
+            cache=cache,
+            connection_policy=connection_policy,
+            timeout=timeout,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
         )
         self.__isolated: OAuth = OAuth(
             client_id=client_id,
@@ -78,18 +107,36 @@ class ManagedHTTPClient(OAuth):
             redirect_uri=redirect_uri,
             scopes=scopes,
             session=session,
+            connection_policy=connection_policy,
+            timeout=timeout,
         )
 
         self._tokens: TokenMapping = {}
+        # Reverse index of token to User-ID, so requests can find the stored token for their Authorization header in O(1)...
+        self._token_index: dict[str, str] = {}
         self._app_token: str | None = None
         self._nested_key: str | None = None
 
         self._token_lock: asyncio.Lock = asyncio.Lock()
+        self._refreshes: dict[str, asyncio.Task[str]] = {}
         self._has_loaded: bool = False
         self._backoff: Backoff = Backoff(base=3, maximum_time=90)
 
         self._validated_event: asyncio.Event = asyncio.Event()
         self._validate_task: asyncio.Task[None] | None = None
+        self._token_validation: TokenValidationPolicy = {**DEFAULT_TOKEN_VALIDATION, **(token_validation or {})}
+
+        # Once tokens are loaded, each change is written to the store in the background by _flush_writes...
+        self._store: TokenStore | None = token_store
+        self._dirty: set[str] = set()
+        self._app_dirty: bool = False
+        self._writer: asyncio.Task[None] | None = None
+
+        # Min-heap of (due, User-ID) for the next validation or refresh of each token. Entries are replaced rather than
+        # removed, so an entry is only current while it matches the due time in _due...
+        self._schedule: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+        self._schedule_wake: asyncio.Event = asyncio.Event()
 
     async def _attempt_refresh_on_add(self, token: str, refresh: str) -> ValidateTokenPayload:
         logger.debug("Token was invalid when attempting to add it to the token manager. Attempting to refresh.")
@@ -109,23 +156,61 @@ class ManagedHTTPClient(OAuth):
         if not valid_resp.login or not valid_resp.user_id:
             logger.info("Refreshed token is not a user token. Adding to TokenManager as an app token.")
             self._app_token = resp.access_token
+            self._persist_app()
 
             return valid_resp
 
-        self._tokens[valid_resp.user_id] = {
-            "user_id": valid_resp.user_id,
-            "token": resp.access_token,
-            "refresh": resp.refresh_token,
-            "last_validated": datetime.datetime.now().isoformat(),
-        }
+        self._store_token(
+            {
+                "user_id": valid_resp.user_id,
+                "token": resp.access_token,
+                "refresh": resp.refresh_token,
+                "last_validated": datetime.datetime.now().isoformat(),
+                "expires_at": self._expires_at(resp.expires_in),
+            }
+        )
 
         logger.info('Token successfully added to TokenManager after refresh: "%s"', valid_resp.user_id)
         return valid_resp
 
-    async def add_token(self, token: str, refresh: str) -> ValidateTokenPayload:
+    def _start_validate_loop(self) -> None:
         if not self._validate_task:
             self._validate_task = asyncio.create_task(self.__validate_loop())
 
+    async def _run_bounded(self, phase: str, calls: list[Callable[[], Awaitable[T]]]) -> list[T | BaseException]:
+        # Runs each call with at most `concurrency` in flight, reporting progress as calls complete. Failures are returned
+        # in place of their result so one token does not stop the rest...
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max(self._token_validation.get("concurrency", 10), 1))
+        hook: Callable[[str, int, int], Any] | None = self._token_validation.get("progress")
+        total: int = len(calls)
+        step: int = max(total // 10, 1)
+        completed: int = 0
+
+        async def run(call: Callable[[], Awaitable[T]]) -> T:
+            nonlocal completed
+
+            async with semaphore:
+                try:
+                    return await call()
+                finally:
+                    completed += 1
+
+                    if completed % step == 0 or completed == total:
+                        logger.debug(
+                            "Token %s progress on %s: %d of %d.", phase, self.__class__.__qualname__, completed, total
+                        )
+
+                    if hook:
+                        try:
+                            hook(phase, completed, total)
+                        except Exception as e:
+                            logger.warning("Ignoring exception in token validation progress hook %r: %s", hook, e)
+
+        return await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+
+    async def add_token(self, token: str, refresh: str) -> ValidateTokenPayload:
+        self._start_validate_loop()
+
         try:
             resp: ValidateTokenPayload = await self.__isolated.validate_token(token)
         except HTTPException as e:
@@ -138,21 +223,107 @@ class ManagedHTTPClient(OAuth):
         if not resp.login or not resp.user_id:
             logger.info("Added token is not a user token. Adding to TokenManager as an app token.")
             self._app_token = token
+            self._persist_app()
 
             return resp
 
-        self._tokens[resp.user_id] = {
-            "user_id": resp.user_id,
-            "token": token,
-            "refresh": refresh,
-            "last_validated": datetime.datetime.now().isoformat(),
-        }
+        self._store_token(
+            {
+                "user_id": resp.user_id,
+                "token": token,
+                "refresh": refresh,
+                "last_validated": datetime.datetime.now().isoformat(),
+                "expires_at": self._expires_at(resp.expires_in),
+            }
+        )
 
         logger.debug('Token successfully added to TokenManager: "%s"', resp.user_id)
         return resp
 
+    def _store_token(self, data: TokenMappingData) -> None:
+        previous: TokenMappingData | None = self._tokens.get(data["user_id"])
+        if previous:
+            self._token_index.pop(previous["token"], None)
+
+        self._tokens[data["user_id"]] = data
+        self._token_index[data["token"]] = data["user_id"]
+        self._reschedule(data)
+        self._persist(data["user_id"])
+
+    def _persist(self, user_id: str) -> None:
+        if self._has_loaded and self._store:
+            self._dirty.add(user_id)
+            self._start_writer()
+
+    def _persist_app(self) -> None:
+        if self._has_loaded and self._store:
+            self._app_dirty = True
+            self._start_writer()
+
+    def _start_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._flush_writes())
+
+    async def _flush_writes(self) -> None:
+        # Only the tokens which changed are written. Changes made while writing are picked up by the next batch...
+        while self._store and (self._dirty or self._app_dirty):
+            store: TokenStore = self._store
+            batch, self._dirty = self._dirty, set()
+            app, self._app_dirty = self._app_dirty, False
+
+            async def write(user_id: str) -> None:
+                data: TokenMappingData | None = self._tokens.get(user_id)
+                await (store.upsert(data) if data else store.delete(user_id))
+
+            writes: list[Coroutine[Any, Any, None]] = [write(user_id) for user_id in batch]
+            if app:
+                writes.append(store.set_app_token(self._app_token))
+
+            for result in await asyncio.gather(*writes, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.warning("Unable to write a token change to %r: %s", store, result)
+
+    @staticmethod
+    def _expires_at(expires_in: int) -> str | None:
+        # Twitch returns 0 for tokens which do not expire...
+        if expires_in <= 0:
+            return None
+
+        return (datetime.datetime.now() + datetime.timedelta(seconds=expires_in)).isoformat()
+
+    def _reschedule(self, data: TokenMappingData) -> None:
+        last_validated: datetime.datetime = datetime.datetime.fromisoformat(data["last_validated"])
+        due: float = last_validated.timestamp() + self.VALIDATE_INTERVAL
+
+        expires_at: str | None = data.get("expires_at")
+        if expires_at:
+            due = min(due, datetime.datetime.fromisoformat(expires_at).timestamp() - self.REFRESH_MARGIN)
+
+        self._due[data["user_id"]] = due
+        heapq.heappush(self._schedule, (due, data["user_id"]))
+
+        # Wake the validation loop if this token is now the next one due...
+        if self._schedule[0] == (due, data["user_id"]):
+            self._schedule_wake.set()
+
+    def _next_due(self) -> float | None:
+        while self._schedule:
+            due, user_id = self._schedule[0]
+            if self._due.get(user_id) == due:
+                return due
+
+            heapq.heappop(self._schedule)
+
+        return None
+
     def remove_token(self, user_id: str) -> TokenMappingData | None:
         data: TokenMappingData | None = self._tokens.pop(user_id, None)
+        if data and self._token_index.get(data["token"]) == user_id:
+            del self._token_index[data["token"]]
+
+        self._due.pop(user_id, None)
+        self._persist(user_id)
+
         return data
 
     def _find_token(self, route: Route) -> TokenMappingData | None | str:
@@ -168,12 +339,22 @@ class ManagedHTTPClient(OAuth):
             if scoped:
                 return scoped
 
-        for data in self._tokens.values():
-            if data["token"] == token:
+        user_id: str | None = self._token_index.get(token) if token else None
+        if user_id is not None:
+            data: TokenMappingData | None = self._tokens.get(user_id)
+            if data:
                 return data
 
         return token or self._app_token
 
+    def _bucket_key(self, route: Route) -> str:
+        # Key user buckets by User-ID so the bucket survives the token being refreshed...
+        found: TokenMappingData | str | None = self._find_token(route)
+        if isinstance(found, dict):
+            return found["user_id"]
+
+        return "app" if found == self._app_token else super()._bucket_key(route)
+
     async def request(self, route: Route) -> RawResponse | str | None:
         old: TokenMappingData | None | str = self._find_token(route)
         if old:
@@ -190,28 +371,80 @@ class ManagedHTTPClient(OAuth):
                 raise e
 
             if isinstance(old, str):
-                payload: ClientCredentialsPayload = await self.client_credentials_token()
-                self._app_token = payload.access_token
-                route.update_headers({"Authorization": f"Bearer {payload.access_token}"})
-
-                return await self.request(route)
+                token = await self._refresh_app_token(old)
+            else:
+                token = await self._refresh_user_token(old)
 
-            logger.debug('Token for "%s" was invalid or expired. Attempting to refresh token.', old["user_id"])
-            refresh: RefreshTokenPayload = await self.__isolated.refresh_token(old["refresh"])
-            logger.debug('Token for "%s" was successfully refreshed.', old["user_id"])
-
-            self._tokens[old["user_id"]] = {
-                "user_id": old["user_id"],
-                "token": refresh.access_token,
-                "refresh": refresh.refresh_token,
-                "last_validated": datetime.datetime.now().isoformat(),
-            }
+            route.update_headers({"Authorization": f"Bearer {token}"})
 
-            route.update_headers({"Authorization": f"Bearer {refresh.access_token}"})
             return await self.request(route)
 
         return data
 
+    async def _refresh_once(self, key: str, refresh: Callable[[], Coroutine[Any, Any, str]]) -> str:
+        # Concurrent 401s for the same token share a single refresh. Twitch rotates refresh tokens, so a second refresh with
+        # the same refresh token would fail...
+        task: asyncio.Task[str] | None = self._refreshes.get(key)
+
+        if task is None:
+            task = asyncio.create_task(refresh())
+            self._refreshes[key] = task
+
+            def remove(done: asyncio.Task[str]) -> None:
+                if self._refreshes.get(key) is done:
+                    del self._refreshes[key]
+
+                # Every caller may have stopped waiting on the refresh, so its exception is always retrieved here...
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(remove)
+
+        # Shield the refresh so one caller being cancelled does not cancel it for every other caller...
+        return await asyncio.shield(task)
+
+    async def _refresh_user_token(self, old: TokenMappingData) -> str:
+        user_id: str = old["user_id"]
+
+        # The token may have already been refreshed since the failed request was sent...
+        current: TokenMappingData | None = self._tokens.get(user_id)
+        if current and current["token"] != old["token"]:
+            return current["token"]
+
+        data: TokenMappingData = current or old
+
+        async def refresh() -> str:
+            logger.debug('Token for "%s" was invalid or expired. Attempting to refresh token.', user_id)
+            payload: RefreshTokenPayload = await self.__isolated.refresh_token(data["refresh"])
+            logger.debug('Token for "%s" was successfully refreshed.', user_id)
+
+            self._store_token(
+                {
+                    "user_id": user_id,
+                    "token": payload.access_token,
+                    "refresh": payload.refresh_token,
+                    "last_validated": datetime.datetime.now().isoformat(),
+                    "expires_at": self._expires_at(payload.expires_in),
+                }
+            )
+            return payload.access_token
+
+        return await self._refresh_once(user_id, refresh)
+
+    async def _refresh_app_token(self, old: str) -> str:
+        if self._app_token and self._app_token != old:
+            return self._app_token
+
+        async def refresh() -> str:
+            logger.debug("App token was invalid or expired. Generating a new app token.")
+            payload: ClientCredentialsPayload = await self.client_credentials_token()
+
+            self._app_token = payload.access_token
+            self._persist_app()
+            return payload.access_token
+
+        return await self._refresh_once("app", refresh)
+
     def request_paginated(
         self,
         route: Route,
@@ -229,40 +462,76 @@ class ManagedHTTPClient(OAuth):
         )
         return iterator
 
-    async def _revalidate_all(self) -> None:
-        logger.debug("Attempting to revalidate all tokens that have passed the timeout on %s.", self.__class__.__qualname__)
+    async def _maintain_token(self, user_id: str) -> None:
+        data: TokenMappingData | None = self._tokens.get(user_id)
+        if not data:
+            return
 
-        for data in self._tokens.copy().values():
-            last_validated: datetime.datetime = datetime.datetime.fromisoformat(data["last_validated"])
-            if last_validated + datetime.timedelta(minutes=60) > datetime.datetime.now():
-                continue
+        expires_at: str | None = data.get("expires_at")
+        expiring: bool = False
+
+        if expires_at:
+            expiring = datetime.datetime.fromisoformat(expires_at).timestamp() - self.REFRESH_MARGIN <= time.time()
 
+        if not expiring:
             try:
-                await self.__isolated.validate_token(data["token"])
+                resp: ValidateTokenPayload = await self.__isolated.validate_token(data["token"])
             except HTTPException as e:
                 if e.status >= 500:
                     raise
+            else:
+                # The token may have been refreshed or removed while we were validating it...
+                if self._tokens.get(user_id) is not data:
+                    return
+
+                self._store_token(
+                    {
+                        **data,
+                        "last_validated": datetime.datetime.now().isoformat(),
+                        "expires_at": self._expires_at(resp.expires_in),
+                    }
+                )
+                return
 
-                logger.debug('Token for "%s" was invalid or expired. Attempting to refresh token.', data["user_id"])
+        try:
+            await self._refresh_user_token(data)
+        except HTTPException as e:
+            if e.status >= 500:
+                raise
 
-                try:
-                    refresh: RefreshTokenPayload = await self.__isolated.refresh_token(data["refresh"])
-                except HTTPException as e:
-                    if e.status >= 500:
-                        raise
+            self.remove_token(user_id)
+            logger.warning('Token for "%s" was invalid and could not be refreshed.', user_id)
 
-                    self._tokens.pop(data["user_id"], None)
-                    logger.warning('Token for "%s" was invalid and could not be refreshed.', data["user_id"])
-                    continue
+    async def _revalidate_all(self) -> None:
+        # Only tokens which are due for their hourly validation, or close to expiring, are processed...
+        now: float = time.time()
+        due: list[tuple[float, str]] = []
 
-                logger.debug('Token for "%s" was successfully refreshed.', data["user_id"])
+        while (next_due := self._next_due()) is not None and next_due <= now:
+            due.append(heapq.heappop(self._schedule))
 
-                self._tokens[data["user_id"]] = {
-                    "user_id": data["user_id"],
-                    "token": refresh.access_token,
-                    "refresh": refresh.refresh_token,
-                    "last_validated": datetime.datetime.now().isoformat(),
-                }
+        if not due:
+            return
+
+        logger.debug("Attempting to revalidate %d tokens on %s.", len(due), self.__class__.__qualname__)
+
+        async def maintain(entry: tuple[float, str]) -> None:
+            try:
+                await self._maintain_token(entry[1])
+            except BaseException:
+                # Tokens which were not rescheduled stay due, so they are retried on the next pass...
+                if self._due.get(entry[1]) == entry[0]:
+                    heapq.heappush(self._schedule, entry)
+
+                raise
+
+        results: list[BaseException | None] = await self._run_bounded(
+            "revalidate", [functools.partial(maintain, entry) for entry in due]
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def __validate_loop(self) -> None:
         logger.debug("Started the token validation loop on %s.", self.__class__.__qualname__)
@@ -280,10 +549,24 @@ class ManagedHTTPClient(OAuth):
                 continue
 
             self._validated_event.set()
-            await asyncio.sleep(60)
+
+            # Sleep until the next token is due, or until a token which is due sooner is added...
+            self._schedule_wake.clear()
+            next_due: float | None = self._next_due()
+            delay: float | None = None if next_due is None else max(next_due - time.time(), 0.0)
+
+            try:
+                await asyncio.wait_for(self._schedule_wake.wait(), timeout=delay)
+            except TimeoutError:
+                pass
 
     def cleanup(self) -> None:
         self._tokens.clear()
+        self._token_index.clear()
+        self._schedule.clear()
+        self._due.clear()
+        self._dirty.clear()
+        self._app_dirty = False
 
     async def close(self) -> None:
         if self._validate_task:
@@ -294,42 +577,128 @@ class ManagedHTTPClient(OAuth):
 
             self._validate_task = None
 
+        for task in self._refreshes.values():
+            task.cancel()
+
+        self._refreshes.clear()
+
+        # Pending writes are finished rather than cancelled so no token change is lost...
+        if self._writer:
+            await self._writer
+            self._writer = None
+
         await super().close()
         await self.__isolated.close()
 
+    def _resolve_store(self, name: str | None) -> TokenStore:
+        # An explicit path always means a JSON file, otherwise the configured store or the default JSON file is used...
+        if name:
+            return JSONTokenStore(name)
+
+        return self._store or JSONTokenStore()
+
     async def save(self, name: str | None = None) -> None:
         if not self._has_loaded:
             return
 
-        name = name or ".tio.tokens.json"
+        store: TokenStore = self._resolve_store(name)
+        await store.sync(self._tokens, self._app_token)
+
+        logger.info("Tokens from %s have been saved to: %r.", self.__class__.__qualname__, store)
+
+    async def load_app_token(self) -> str | None:
+        # Reuse the app token stored by a previous run when it is still valid for this Client-ID...
+        store: TokenStore = self._store or JSONTokenStore()
+        token: str | None = await store.get_app_token()
+        if not token:
+            return None
+
+        try:
+            resp: ValidateTokenPayload = await self.__isolated.validate_token(token)
+        except HTTPException:
+            logger.debug("The stored app token is no longer valid. A new app token will be generated.")
+            return None
+
+        if resp.login or resp.user_id or resp.client_id != self.client_id:
+            return None
+
+        return token
+
+    def _is_fresh(self, value: TokenMappingData) -> bool:
+        # Tokens validated within the last interval, and not close to expiring, can wait for the scheduler...
+        try:
+            due: float = datetime.datetime.fromisoformat(value["last_validated"]).timestamp() + self.VALIDATE_INTERVAL
+            expires_at: str | None = value.get("expires_at")
 
-        with open(name, "w+", encoding="UTF-8") as fp:
-            json.dump(self._tokens, fp)
+            if expires_at:
+                due = min(due, datetime.datetime.fromisoformat(expires_at).timestamp() - self.REFRESH_MARGIN)
+        except (KeyError, TypeError, ValueError):
+            return False
 
-        logger.info('Tokens from %s have been saved to: "%s".', self.__class__.__qualname__, name)
+        return all(value.get(k) for k in ("user_id", "token", "refresh")) and due > time.time()
 
     async def load_tokens(self, name: str | None = None) -> None:
-        name = name or ".tio.tokens.json"
-        data: dict[str, Any] = {}
         failed: list[str] = []
         loaded: int = 0
+        deferred: int = 0
 
-        try:
-            with open(name, "r+", encoding="UTF-8") as fp:
-                data = json.load(fp)
-        except FileNotFoundError:
-            pass
+        store: TokenStore = self._resolve_store(name)
+        self._store = store
+
+        data: TokenMapping = await store.load()
+        stored_app: str | None = await store.get_app_token()
+
+        fast_start: bool = self._token_validation.get("fast_start", False)
+        keys: list[str] = []
+        calls: list[Callable[[], Awaitable[ValidateTokenPayload]]] = []
 
         for key, value in data.items():
-            try:
-                await self.add_token(token=value["token"], refresh=value["refresh"])
-                loaded += 1
-            except InvalidTokenException:
+            if fast_start and self._is_fresh(value):
+                # Validation is deferred until the token is next due...
+                self._store_token(
+                    {
+                        "user_id": value["user_id"],
+                        "token": value["token"],
+                        "refresh": value["refresh"],
+                        "last_validated": value["last_validated"],
+                        "expires_at": value.get("expires_at"),
+                    }
+                )
+                deferred += 1
+                continue
+
+            keys.append(key)
+            calls.append(functools.partial(self.add_token, token=value["token"], refresh=value["refresh"]))
+
+        if deferred:
+            self._start_validate_loop()
+
+        error: BaseException | None = None
+        for key, result in zip(keys, await self._run_bounded("load", calls)):
+            if isinstance(result, InvalidTokenException):
                 failed.append(key)
+            elif isinstance(result, BaseException):
+                error = error or result
+            else:
+                loaded += 1
+
+        if error:
+            raise error
 
-        logger.info("Loaded %s tokens into the Token Manager.", loaded)
+        logger.info(
+            "Loaded %s tokens into the Token Manager (%d validated, %d deferred).", loaded + deferred, loaded, deferred
+        )
         if failed:
             msg: str = f"The following users tokens failed to load: {', '.join(failed)}"
             logger.warning(msg)
 
         self._has_loaded = True
+
+        # Tokens which were refreshed while loading, and a newly generated app token, are written straight away...
+        for user_id, current in self._tokens.items():
+            stored: TokenMappingData | None = data.get(user_id)
+            if not stored or (stored["token"], stored["refresh"]) != (current["token"], current["refresh"]):
+                self._persist(user_id)
+
+        if self._app_token != stored_app:
+            self._persist_app()
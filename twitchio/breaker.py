@@ -0,0 +1,311 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .types_.options import CircuitBreakerPolicy
+
+
+__all__ = ("CircuitBreaker", "CircuitBreakers", "CircuitState")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+DEFAULT_CIRCUIT_BREAKER_POLICY: CircuitBreakerPolicy = {
+    "error_rate": 0.5,
+    "minimum_requests": 20,
+    "window": 30.0,
+    "cooldown": 15.0,
+}
+
+
+class CircuitState(enum.Enum):
+    """The state of a :class:`CircuitBreaker`.
+
+    Attributes
+    ----------
+    CLOSED
+        Requests are sent as normal and their outcomes are recorded.
+    OPEN
+        Too many recent requests failed. Requests fail immediately until the cool-down has passed.
+    HALF_OPEN
+        The cool-down has passed and a single trial request is allowed through. If it succeeds the breaker closes,
+        otherwise it opens again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+BreakerHook: TypeAlias = Callable[["CircuitBreaker", CircuitState], Any]
+
+
+class CircuitBreaker:
+    """A circuit breaker for a single route template.
+
+    The outcome of each request attempt made in the last ``window`` seconds is recorded. A response with a status of ``500``
+    or above, or a connection error, counts as a failure. Once at least ``minimum_requests`` attempts were recorded and the
+    fraction of failures reaches ``error_rate``, the breaker opens and requests to the route raise
+    :exc:`~twitchio.CircuitOpenException` without being sent.
+
+    After ``cooldown`` seconds a single trial request is allowed through. The breaker closes if it succeeds and opens again
+    if it fails. Outcomes of requests which started before the breaker last changed state are ignored.
+
+    Attributes
+    ----------
+    method: str
+        The request method of the route.
+    path: str
+        The route template this breaker belongs to. E.g. ``"streams"``.
+    state: :class:`CircuitState`
+        The current state of the breaker.
+    opened_at: float
+        The :func:`time.monotonic` timestamp the breaker last opened at. Could be ``0.0`` if it has never opened.
+    """
+
+    __slots__ = (
+        "_failures",
+        "_generation",
+        "_hook",
+        "_outcomes",
+        "_policy",
+        "_trial",
+        "method",
+        "opened_at",
+        "path",
+        "state",
+    )
+
+    def __init__(self, method: str, path: str, *, policy: CircuitBreakerPolicy, hook: BreakerHook | None = None) -> None:
+        self.method: str = method
+        self.path: str = path
+        self.state: CircuitState = CircuitState.CLOSED
+        self.opened_at: float = 0.0
+
+        self._policy: CircuitBreakerPolicy = policy
+        self._hook: BreakerHook | None = hook
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures: int = 0
+
+        # Bumped on every state change and every trial let through, so each request can be matched to the state it was
+        # allowed in. The ticket of the trial request in flight while half-open, if any...
+        self._generation: int = 0
+        self._trial: int | None = None
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(method={self.method}, path={self.path}, state={self.state.value})"
+
+    @property
+    def error_rate(self) -> float:
+        """Property returning the fraction of request attempts which failed within the current window."""
+        self._prune(time.monotonic())
+
+        if not self._outcomes:
+            return 0.0
+
+        return self._failures / len(self._outcomes)
+
+    @property
+    def retry_after(self) -> float:
+        """Property returning the amount of seconds until a trial request will be allowed. ``0.0`` unless the breaker
+        is open.
+        """
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+
+        return max(self.opened_at + self._policy.get("cooldown", 15.0) - time.monotonic(), 0.0)
+
+    def _prune(self, now: float) -> None:
+        cutoff: float = now - self._policy.get("window", 30.0)
+
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def _transition(self, state: CircuitState) -> None:
+        previous: CircuitState = self.state
+        if previous is state:
+            return
+
+        self.state = state
+        self._generation += 1
+
+        if state is CircuitState.OPEN:
+            self.opened_at = time.monotonic()
+            logger.warning(
+                "Circuit breaker for %s %r opened. Requests will fail immediately for %.2f seconds.",
+                self.method,
+                self.path,
+                self._policy.get("cooldown", 15.0),
+            )
+        else:
+            logger.info("Circuit breaker for %s %r is now %s.", self.method, self.path, state.value)
+
+        if state is CircuitState.CLOSED:
+            self._clear()
+
+        if self._hook:
+            try:
+                self._hook(self, previous)
+            except Exception as e:
+                logger.warning("Ignoring exception in circuit breaker hook %r: %s", self._hook, e)
+
+    def _clear(self) -> None:
+        self._outcomes.clear()
+        self._failures = 0
+
+    def allow(self) -> int | None:
+        # Returns a ticket to pass to record() once the request completes, or None when the request must not be sent...
+        if self.state is CircuitState.CLOSED:
+            return self._generation
+
+        if self.state is CircuitState.OPEN:
+            if self.retry_after > 0:
+                return None
+
+            self._transition(CircuitState.HALF_OPEN)
+
+        # Only one trial request is let through at a time while half-open...
+        if self._trial is not None:
+            return None
+
+        self._generation += 1
+        self._trial = self._generation
+        return self._trial
+
+    def record(self, ticket: int, failed: bool | None) -> None:
+        # None means the attempt ended without an outcome, E.g. it was cancelled, so it only gives up the trial slot...
+        if self.state is CircuitState.HALF_OPEN:
+            # Only the trial decides whether the breaker closes. Requests which started before the breaker opened tell us
+            # nothing about whether the endpoint has recovered...
+            if ticket != self._trial:
+                return
+
+            self._trial = None
+
+            if failed is not None:
+                self._transition(CircuitState.OPEN if failed else CircuitState.CLOSED)
+
+            return
+
+        # Requests which were already in flight when the breaker last changed state tell us nothing new...
+        if failed is None or self.state is CircuitState.OPEN or ticket != self._generation:
+            return
+
+        now: float = time.monotonic()
+        self._outcomes.append((now, failed))
+        self._failures += failed
+        self._prune(now)
+
+        if len(self._outcomes) < self._policy.get("minimum_requests", 20):
+            return
+
+        if self.error_rate >= self._policy.get("error_rate", 0.5):
+            self._transition(CircuitState.OPEN)
+
+    def reset(self) -> None:
+        """Close the breaker and forget every recorded outcome."""
+        self._trial = None
+        self._transition(CircuitState.CLOSED)
+        self._clear()
+
+
+class CircuitBreakers:
+    """A collection of :class:`CircuitBreaker`, one for each route template requested.
+
+    Parameters
+    ----------
+    policy: dict[str, Any] | None
+        An optional mapping used to tune each breaker. Missing keys use the defaults:
+
+        - ``error_rate``: The fraction of failed attempts which opens a breaker. Defaults to ``0.5``.
+        - ``minimum_requests``: The amount of attempts which must be recorded in the window before a breaker can open.
+          Defaults to ``20``.
+        - ``window``: The amount of seconds of recent attempts used to calculate the error rate. Defaults to ``30``.
+        - ``cooldown``: The amount of seconds a breaker stays open before allowing a trial request. Defaults to ``15``.
+    hook: Callable[[CircuitBreaker, CircuitState], Any] | None
+        An optional callable which is called with the breaker and its previous state whenever a breaker changes state.
+    """
+
+    __slots__ = ("_breakers", "hook", "policy")
+
+    def __init__(self, policy: CircuitBreakerPolicy | None = None, *, hook: BreakerHook | None = None) -> None:
+        self.policy: CircuitBreakerPolicy = {**DEFAULT_CIRCUIT_BREAKER_POLICY, **(policy or {})}
+        self.hook: BreakerHook | None = hook
+
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+
+    def __repr__(self) -> str:
+        return f"CircuitBreakers(breakers={len(self._breakers)})"
+
+    def __iter__(self) -> Iterator[CircuitBreaker]:
+        return iter(list(self._breakers.values()))
+
+    def __len__(self) -> int:
+        return len(self._breakers)
+
+    def _call_hook(self, breaker: CircuitBreaker, previous: CircuitState) -> None:
+        # Looked up on each call so the hook can be set after breakers were created...
+        if self.hook:
+            self.hook(breaker, previous)
+
+    def get_breaker(self, method: str, path: str) -> CircuitBreaker:
+        key: tuple[str, str] = (method.upper(), path.strip("/"))
+
+        try:
+            breaker: CircuitBreaker = self._breakers[key]
+        except KeyError:
+            breaker = self._breakers[key] = CircuitBreaker(*key, policy=self.policy, hook=self._call_hook)
+
+        return breaker
+
+    def get(self, method: str, path: str) -> CircuitBreaker | None:
+        """Return the :class:`CircuitBreaker` for a route template, or ``None`` if it has not been requested.
+
+        Parameters
+        ----------
+        method: str
+            The request method. E.g. ``"GET"``.
+        path: str
+            The route template. E.g. ``"streams"``.
+        """
+        return self._breakers.get((method.upper(), path.strip("/")))
+
+    def reset(self) -> None:
+        """Close every breaker and forget every recorded outcome."""
+        for breaker in self._breakers.values():
+            breaker.reset()
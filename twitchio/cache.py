@@ -0,0 +1,215 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping
+
+
+__all__ = ("CacheStats", "ResponseCache")
+
+
+_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar("twitchio_cache_bypass", default=False)
+
+
+class CacheStats(NamedTuple):
+    """NamedTuple that represents the statistics of a :class:`~twitchio.ResponseCache`.
+
+    Attributes
+    ----------
+    hits: int
+        The amount of requests which were answered from the cache.
+    misses: int
+        The amount of cacheable requests which had to be sent to Twitch.
+    evictions: int
+        The amount of entries removed because the cache was full.
+    size: int
+        The amount of entries currently held in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class ResponseCache:
+    """An optional TTL and LRU cache for responses from read-mostly Helix endpoints.
+
+    Only ``GET`` requests to endpoints with a TTL are cached. Responses are cached per URL, including query parameters, and
+    per token used for the request. When the cache is full, the least recently used entry is evicted.
+
+    You can enable the cache by passing an instance to the ``response_cache`` keyword-argument of
+    :class:`~twitchio.Client`.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum amount of responses to hold in the cache. Defaults to ``1024``.
+    ttls: Mapping[str, float] | None
+        An optional mapping of endpoint path, E.g. ``"chat/emotes/global"``, to the amount of seconds a response should be
+        cached for. These are merged with, and override, :attr:`DEFAULT_TTLS`. Set a TTL to ``0`` to disable caching
+        for an endpoint.
+
+    Examples
+    --------
+
+    .. code:: python3
+
+        client = twitchio.Client(..., response_cache=twitchio.ResponseCache(maxsize=2048, ttls={"users": 60}))
+
+        # Skip the cache for a single call...
+        with client.response_cache.bypass():
+            users = await client.fetch_users(ids=[...])
+
+        # Remove cached responses for an endpoint...
+        client.response_cache.invalidate("users")
+    """
+
+    DEFAULT_TTLS: ClassVar[dict[str, float]] = {
+        "bits/cheermotes": 3600,
+        "chat/badges/global": 3600,
+        "chat/emotes/global": 3600,
+        "content_classification_labels": 86400,
+        "games": 3600,
+        "users": 300,
+    }
+
+    __slots__ = ("_entries", "_evictions", "_hits", "_misses", "maxsize", "ttls")
+
+    def __init__(self, *, maxsize: int = 1024, ttls: Mapping[str, float] | None = None) -> None:
+        self.maxsize: int = max(1, maxsize)
+        self.ttls: dict[str, float] = {**self.DEFAULT_TTLS, **(ttls or {})}
+
+        self._entries: OrderedDict[tuple[str, str], tuple[float, str, Any]] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(maxsize={self.maxsize}, size={len(self._entries)})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Property returning the current :class:`~twitchio.CacheStats` for this cache."""
+        return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions, size=len(self._entries))
+
+    @property
+    def bypassed(self) -> bool:
+        """Property returning whether the cache is currently being bypassed with :meth:`bypass`."""
+        return _bypass.get()
+
+    @contextlib.contextmanager
+    def bypass(self) -> Generator[None, None, None]:
+        """Context manager which skips reading from the cache for any requests made inside of it.
+
+        Fresh responses received while bypassing are still stored in the cache.
+        """
+        token = _bypass.set(True)
+
+        try:
+            yield
+        finally:
+            _bypass.reset(token)
+
+    def cacheable(self, path: str) -> bool:
+        return self.ttls.get(path, 0) > 0
+
+    def get(self, path: str, key: tuple[str, str]) -> Any | None:
+        if not self.cacheable(path) or _bypass.get():
+            return None
+
+        try:
+            expires, _, data = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            return None
+
+        if expires <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return data
+
+    def set(self, path: str, key: tuple[str, str], data: Any) -> None:
+        ttl: float = self.ttls.get(path, 0)
+        if ttl <= 0 or data is None:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, path, data)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, path: str | None = None) -> int:
+        """Remove cached responses.
+
+        Parameters
+        ----------
+        path: str | None
+            The endpoint path to remove cached responses for, E.g. ``"users"``. If ``None``, every response is removed.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        int
+            The amount of responses removed from the cache.
+        """
+        if path is None:
+            removed: int = len(self._entries)
+            self._entries.clear()
+
+            return removed
+
+        path = path.strip("/")
+        keys: list[tuple[str, str]] = [k for k, (_, p, _) in self._entries.items() if p == path]
+
+        for key in keys:
+            del self._entries[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every cached response and reset the statistics."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
@@ -41,7 +41,7 @@ from .models.channels import ChannelInfo
 from .models.chat import ChatBadge, ChatterColor, EmoteSet, GlobalEmote
 from .models.games import Game
 from .models.teams import Team
-from .payloads import EventErrorPayload
+from .payloads import CircuitBreakerPayload, EventErrorPayload
 from .user import ActiveExtensions, Extension, PartialUser, User
 from .utils import MISSING, EventWaiter, unwrap_function
 from .web import AiohttpAdapter
@@ -49,14 +49,18 @@ from .web.utils import BaseAdapter
 
 
 if TYPE_CHECKING:
+    import contextlib
     import datetime
     from collections.abc import Awaitable, Callable, Coroutine
 
     import aiohttp
 
-    from .authentication import ClientCredentialsPayload, ValidateTokenPayload
+    from .authentication import ClientCredentialsPayload, TokenStore, ValidateTokenPayload
+    from .breaker import CircuitBreaker, CircuitBreakers, CircuitState
+    from .cache import ResponseCache
     from .eventsub.subscriptions import SubscriptionPayload
     from .http import HTTPAsyncIterator
+    from .metrics import HTTPMetrics
     from .models.clips import Clip
     from .models.entitlements import Entitlement, EntitlementStatus
     from .models.eventsub_ import EventsubSubscriptions
@@ -64,7 +68,14 @@ if TYPE_CHECKING:
     from .models.streams import Stream, VideoMarkers
     from .models.videos import Video
     from .types_.eventsub import SubscriptionCreateTransport, SubscriptionResponse, _SubscriptionData
-    from .types_.options import ClientOptions, WaitPredicateT
+    from .types_.options import (
+        CircuitBreakerPolicy,
+        ClientOptions,
+        ConnectionPolicy,
+        HedgePolicy,
+        TokenValidationPolicy,
+        WaitPredicateT,
+    )
     from .types_.tokens import TokenMappingData
 
 
@@ -116,6 +127,68 @@ class Client:
         An optional bool indicating whether to fetch and cache the client/bot accounts own :class:`.User` object to use with
         :attr:`.user`.
         Defaults to ``True``. You must pass ``bot_id`` for this parameter to have any effect.
+    response_cache: twitchio.ResponseCache | None
+        An optional :class:`~twitchio.ResponseCache` used to cache responses from read-mostly endpoints, such as global
+        emotes, badges and cheermotes. Defaults to ``None`` which disables response caching.
+    connection_policy: dict[str, Any] | None
+        An optional mapping used to tune the connection pool of the HTTP session created by the client. Ignored for
+        requests made with a ``session`` you provide. Any of the following keys can be set:
+
+        - ``limit``: The maximum amount of open connections. Defaults to ``100``.
+        - ``limit_per_host``: The maximum amount of open connections to a single host. Defaults to ``0`` (no limit).
+        - ``keepalive_timeout``: The amount of seconds an idle connection is kept open for reuse. Defaults to ``30``.
+        - ``ttl_dns_cache``: The amount of seconds DNS results are cached for, or ``None`` to cache forever.
+          Defaults to ``300``.
+        - ``prewarm``: The amount of connections to Helix to open during :meth:`.login`. Defaults to ``0``.
+
+        EventSub websockets always share a single session, which reuses the DNS cache setting.
+    request_timeout: float | None
+        An optional default amount of seconds each request to the Twitch API may take, including time spent waiting for the
+        rate limit and retrying. Requests which take longer raise :exc:`~twitchio.HTTPTimeoutException`. Defaults to
+        ``None`` which means requests have no timeout. See also: :meth:`.timeout`.
+    circuit_breaker: dict[str, Any] | None
+        An optional mapping which enables a circuit breaker for each endpoint of the Twitch API. While too many recent
+        requests to an endpoint fail, requests to it raise :exc:`~twitchio.CircuitOpenException` immediately instead of
+        being sent. State changes are dispatched to :func:`~twitchio.event_circuit_breaker`. Pass an empty ``dict`` to use
+        the defaults, or set any of the following keys:
+
+        - ``error_rate``: The fraction of failed requests which opens a breaker. Defaults to ``0.5``.
+        - ``minimum_requests``: The amount of requests which must be made in the window before a breaker can open.
+          Defaults to ``20``.
+        - ``window``: The amount of seconds of recent requests used to calculate the error rate. Defaults to ``30``.
+        - ``cooldown``: The amount of seconds a breaker stays open before allowing a trial request. Defaults to ``15``.
+
+        Defaults to ``None`` which disables circuit breakers.
+    hedging: dict[str, Any] | None
+        An optional mapping which enables hedging of ``GET`` requests to the Twitch API. When a response has not arrived
+        within a threshold, a second identical request is sent. The first successful response is used and the other
+        request is cancelled. Each hedged request uses a point from the rate limit, so hedges are only sent while the rate
+        limit bucket has points to spare. Pass an empty ``dict`` to use the defaults, or set any of the following keys:
+
+        - ``delay``: A fixed threshold in seconds. Defaults to ``None``, which uses ``percentile`` instead.
+        - ``percentile``: The latency percentile of recent requests to the same endpoint used as the threshold, see
+          :attr:`.http_metrics`. Defaults to ``95``.
+        - ``minimum_samples``: The amount of requests which must have been made to an endpoint before its requests are
+          hedged using ``percentile``. Defaults to ``20``.
+        - ``minimum_delay``: The smallest threshold allowed, in seconds. Defaults to ``0.05``.
+        - ``routes``: An optional collection of endpoints to hedge, E.g. ``{"users", "streams"}``. Defaults to ``None``
+          which hedges every ``GET`` request.
+
+        Defaults to ``None`` which disables hedging.
+    token_validation: dict[str, Any] | None
+        An optional mapping used to tune how managed tokens are validated when they are loaded by :meth:`.load_tokens`,
+        and when they are revalidated on Twitch's hourly schedule. Any of the following keys can be set:
+
+        - ``concurrency``: The maximum amount of tokens validated or refreshed at the same time. Defaults to ``10``.
+        - ``fast_start``: Whether tokens loaded from :meth:`.save_tokens` which were validated within the last hour are
+          added without validating them again. They are validated when they are next due instead. Defaults to ``False``.
+        - ``progress``: An optional callable which is called with the phase, either ``"load"`` or ``"revalidate"``, and
+          the amount of tokens completed and total after each token. Defaults to ``None``.
+    token_store: twitchio.authentication.TokenStore | None
+        An optional :class:`~twitchio.authentication.TokenStore` used by :meth:`.load_tokens` and :meth:`.save_tokens`
+        when they are called without a path. Once tokens are loaded, each refreshed, added or removed token and the app
+        token are written to the store as they change. Defaults to ``None`` which uses a
+        :class:`~twitchio.authentication.JSONTokenStore` for the file ``".tio.tokens.json"``.
     """
 
     def __init__(
@@ -129,6 +202,13 @@ class Client:
         redirect_uri: str | None = options.get("redirect_uri")
         scopes: Scopes | None = options.get("scopes")
         session: aiohttp.ClientSession = options.get("session", MISSING) or MISSING
+        cache: ResponseCache | None = options.get("response_cache")
+        connection_policy: ConnectionPolicy | None = options.get("connection_policy")
+        timeout: float | None = options.get("request_timeout")
+        circuit_breaker: CircuitBreakerPolicy | None = options.get("circuit_breaker")
+        hedging: HedgePolicy | None = options.get("hedging")
+        token_validation: TokenValidationPolicy | None = options.get("token_validation")
+        token_store: TokenStore | None = options.get("token_store")
         self._bot_id: str | None = bot_id
 
         self._http = ManagedHTTPClient(
@@ -137,7 +217,17 @@ class Client:
             redirect_uri=redirect_uri,
             scopes=scopes,
             session=session,
+            cache=cache,
+            connection_policy=connection_policy,
+            timeout=timeout,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            token_validation=token_validation,
+            token_store=token_store,
         )
+        if self._http.breakers is not None:
+            self._http.breakers.hook = self._on_circuit_change
+
         adapter: BaseAdapter | type[BaseAdapter] = options.get("adapter", AiohttpAdapter)
         if isinstance(adapter, BaseAdapter):
             adapter.client = self
@@ -186,6 +276,57 @@ class Client:
         """
         return MappingProxyType(self._http._tokens)
 
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Property which returns the :class:`~twitchio.ResponseCache` used by this `Client`, or ``None`` if response
+        caching is disabled.
+
+        See: the ``response_cache`` parameter of :class:`~twitchio.Client`.
+        """
+        return self._http._cache
+
+    def timeout(self, seconds: float) -> contextlib.AbstractContextManager[None]:
+        """Context manager which sets a deadline for every request made to the Twitch API inside of it.
+
+        The deadline covers time spent waiting for the rate limit, retries and reading responses, across all requests made
+        in the context combined. Once it passes, the request being made is cancelled and
+        :exc:`~twitchio.HTTPTimeoutException` is raised. Nested contexts can only shorten the deadline.
+
+        Parameters
+        ----------
+        seconds: float
+            The amount of seconds from entering the context that requests must complete within.
+
+        Examples
+        --------
+
+        .. code:: python3
+
+            with client.timeout(5):
+                users = await client.fetch_users(logins=["chillymosh", "eviee"])
+                streams = await client.fetch_streams(user_logins=["chillymosh", "eviee"])
+        """
+        return self._http.deadline(seconds)
+
+    @property
+    def http_metrics(self) -> HTTPMetrics:
+        """Property which returns the :class:`~twitchio.HTTPMetrics` recording the latency and status of each request made
+        to the Twitch API by this `Client`.
+        """
+        return self._http.metrics
+
+    @property
+    def circuit_breakers(self) -> CircuitBreakers | None:
+        """Property which returns the :class:`~twitchio.CircuitBreakers` used by this `Client`, or ``None`` if circuit
+        breakers are disabled.
+
+        See: the ``circuit_breaker`` parameter of :class:`~twitchio.Client`.
+        """
+        return self._http.breakers
+
+    def _on_circuit_change(self, breaker: CircuitBreaker, previous: CircuitState) -> None:
+        self.dispatch("circuit_breaker", CircuitBreakerPayload(breaker=breaker, previous=previous))
+
     @property
     def bot_id(self) -> str | None:
         """Property which returns the User-ID associated with this :class:`~twitchio.Client` if set, or `None`.
@@ -298,7 +439,9 @@ class Client:
             An optional app token to use instead of generating one automatically.
         load_tokens: bool
             Optional bool which indicates whether the :class:`Client` should call :meth:`.load_tokens` during
-            login automatically. Defaults to ``True``.
+            login automatically. When ``True`` and no ``token`` is provided, a valid app token saved by a previous run is
+            reused. This only happens when ``token_store`` is set, or :meth:`.load_tokens` has not been overridden.
+            Defaults to ``True``.
         save_tokens: bool
             Optional bool which inicates whether the :class:`Client` should call :meth:`.save_tokens` during the
             :meth:`.close` automatically. Defaults to ``True``.
@@ -315,14 +458,28 @@ class Client:
         if not token and not self._http.client_secret:
             raise RuntimeError(f'Expected a valid "client_secret", instead received: {self._http.client_secret}')
 
-        if not token:
-            payload: ClientCredentialsPayload = await self._http.client_credentials_token()
-            validated: ValidateTokenPayload = await self._http.validate_token(payload.access_token)
-            token = payload.access_token
+        prewarm: asyncio.Task[int] = asyncio.create_task(self._http.prewarm())
 
-            logger.info("Generated App Token for Client-ID: %s", validated.client_id)
+        try:
+            # An app token stored by a previous run is reused while it is still valid. It is only read from a configured
+            # token store, or from the default file when load_tokens has not been overridden to load tokens elsewhere...
+            stored: bool = self._http._store is not None or type(self).load_tokens is Client.load_tokens
+            if not token and load_tokens and stored:
+                token = await self._http.load_app_token()
+
+            if not token:
+                payload: ClientCredentialsPayload = await self._http.client_credentials_token()
+                validated: ValidateTokenPayload = await self._http.validate_token(payload.access_token)
+                token = payload.access_token
 
-        self._http._app_token = token
+                logger.info("Generated App Token for Client-ID: %s", validated.client_id)
+
+            self._http._app_token = token
+            await prewarm
+        finally:
+            # The pre-warm must not outlive a failed login, and its outcome is always retrieved...
+            prewarm.cancel()
+            await asyncio.gather(prewarm, return_exceptions=True)
 
         if load_tokens:
             async with self._http._token_lock:
@@ -676,7 +833,11 @@ class Client:
         You can override this method to implement your own token loading logic into the client, such as from a database.
 
         By default this method loads tokens from a file named `".tio.tokens.json"` if it is present;
-        always present if you use the default method of saving tokens.
+        always present if you use the default method of saving tokens. When the ``token_store`` keyword-argument of
+        :class:`~Client` is set and ``path`` is ``None``, tokens are loaded from that store instead.
+
+        Once loaded, each token which is refreshed, added or removed is written to the store straight away, so changes
+        are not lost if the client does not close gracefully.
 
         **However**, it is preferred you would override this function to load your tokens from a database,
         as this has far less chance of being corrupted, damaged or lost.
@@ -721,6 +882,9 @@ class Client:
         You can override this method to implement your own custom logic, such as saving tokens to a database, however
         it is preferred to use :meth:`~.add_token` to ensure the tokens are handled as they are added.
 
+        When the ``token_store`` keyword-argument of :class:`~Client` is set and ``path`` is ``None``, tokens are saved to
+        that store instead.
+
         Parameters
         ----------
         path: str | None
@@ -933,7 +1097,7 @@ class Client:
         Parameters
         -----------
         user_ids: list[str | int]
-            A list of user ids to fetch the colours for.
+            A list of user ids to fetch the colours for. More than **100** IDs are split into multiple concurrent requests.
         token_for: str | PartialUser | None
             |token_for|
 
@@ -942,9 +1106,6 @@ class Client:
         list[:class:`~twitchio.ChatterColor`]
             A list of :class:`~twitchio.ChatterColor` objects associated with the passed user IDs.
         """
-        if len(user_ids) > 100:
-            raise ValueError("Maximum of 100 user_ids")
-
         data = await self._http.get_user_chat_color(user_ids, token_for)
         return [ChatterColor(d, http=self._http) for d in data["data"] if data]
 
@@ -962,7 +1123,7 @@ class Client:
         ----------
         broadcaster_ids: list[str | int]
             A list of channel IDs to request from API.
-            You may specify a maximum of **100** IDs.
+            More than **100** IDs are split into multiple concurrent requests.
         token_for: str | PartialUser | None
             |token_for|
 
@@ -971,9 +1132,6 @@ class Client:
         list[:class:`~twitchio.ChannelInfo`]
             A list of :class:`~twitchio.ChannelInfo` objects.
         """
-        if len(broadcaster_ids) > 100:
-            raise ValueError("Maximum of 100 broadcaster_ids")
-
         data = await self._http.get_channel_info(broadcaster_ids, token_for)
         return [ChannelInfo(d, http=self._http) for d in data["data"]]
 
@@ -1042,6 +1200,7 @@ class Client:
         token_for: str | PartialUser | None = None,
         first: int = 20,
         max_results: int | None = None,
+        windows: int = 1,
     ) -> HTTPAsyncIterator[Clip]:
         """|aiter|
 
@@ -1071,6 +1230,11 @@ class Client:
         max_results: int | None
             The maximum number of total results to return. When this parameter is set to `None`, all results are returned.
             Defaults to `None`.
+        windows: int
+            The amount of equal time windows to split the range between ``started_at`` and ``ended_at`` into. Each window is
+            paginated concurrently, within the rate limit of the token, and clips are yielded in the order pages arrive
+            rather than in order of time. Clips found in more than one window are only returned once. Both ``started_at``
+            and ``ended_at`` are required when this is above ``1``. Defaults to ``1``.
 
         Returns
         --------
@@ -1082,6 +1246,8 @@ class Client:
             Only one of `game_id` or `clip_ids` can be provided.
         ValueError
             You must provide either a `game_id` *or* `clip_ids`.
+        ValueError
+            `started_at` and `ended_at` must be provided when `windows` is above 1.
         """
 
         provided: int = len([v for v in (game_id, clip_ids) if v])
@@ -1090,6 +1256,9 @@ class Client:
         elif provided == 0:
             raise ValueError("One of 'game_id' or 'clip_ids' must be provided.")
 
+        if windows > 1 and not (started_at and ended_at):
+            raise ValueError("Both 'started_at' and 'ended_at' must be provided when 'windows' is above 1.")
+
         first = max(1, min(100, first))
 
         return self._http.get_clips(
@@ -1101,6 +1270,7 @@ class Client:
             is_featured=featured,
             max_results=max_results,
             token_for=token_for,
+            windows=windows,
         )
 
     def fetch_extension_transactions(
@@ -1489,11 +1659,8 @@ class Client:
 
         .. note::
 
-            You may look up users using their user ID, login name, or both but the sum total
-            of the number of users you may look up is `100`.
-
-            For example, you may specify `50` IDs and `50` names or `100` IDs or names,
-            but you cannot specify `100` IDs and `100` names.
+            You may look up users using their user ID, login name, or both. When more than `100` users are requested,
+            the lookup is split into multiple concurrent requests and the results are returned in the order requested.
 
             If you don't specify IDs or login names but provide the `token_for` parameter,
             the request returns information about the user associated with the access token.
@@ -1501,6 +1668,10 @@ class Client:
             To include the user's verified email address in the response,
             you must have a user access token that includes the `user:read:email` scope.
 
+        .. note::
+
+            Lookups made concurrently with the same token are automatically merged into a single request to Twitch.
+
         Parameters
         ----------
         ids: list[str | int] | None
@@ -1517,16 +1688,8 @@ class Client:
         -------
         list[:class:`twitchio.User`]
             A list of :class:`twitchio.User` objects.
-
-        Raises
-        ------
-        ValueError
-            The combined number of 'ids' and 'logins' must not exceed `100` elements.
         """
 
-        if (len(ids or []) + len(logins or [])) > 100:
-            raise ValueError("The combined number of 'ids' and 'logins' must not exceed 100 elements.")
-
         data = await self._http.get_users(ids=ids, logins=logins, token_for=token_for)
         return [User(d, http=self._http) for d in data["data"]]
 
@@ -178,9 +178,7 @@ class Websocket:
 
         while True:
             try:
-                async with aiohttp.ClientSession() as session:
-                    new = await session.ws_connect(url_, heartbeat=self._heartbeat)
-                    session.detach()
+                new = await self._http.ws_connect(url_, heartbeat=self._heartbeat)
             except Exception as e:
                 logger.debug("Failed to connect to eventsub websocket <%s>: %s.", self, e)
 
@@ -28,7 +28,9 @@ from typing import TYPE_CHECKING, Any
 
 
 __all__ = (
+    "CircuitOpenException",
     "HTTPException",
+    "HTTPTimeoutException",
     "InvalidTokenException",
     "MessageRejectedError",
     "TwitchioException",
@@ -83,6 +85,56 @@ class HTTPException(TwitchioException):
         super().__init__(msg)
 
 
+class HTTPTimeoutException(HTTPException):
+    """Exception raised when an HTTP request does not complete before its timeout or deadline.
+
+    The time covers waiting for the rate limit, every retry and reading the response. When this is raised the request has
+    been cancelled and its place in the rate limit queue has been given up.
+
+    This exception inherits from :exc:`~twitchio.HTTPException`. The ``status`` is always ``408``.
+
+    Attributes
+    ----------
+    route: :class:`twitchio.Route` | None
+        The :class:`twitchio.Route` of the request which timed out.
+    status: int
+        Always ``408``.
+    extra: dict[Literal["message"], str]
+        A dict with a single key named "message".
+    timeout: float
+        The amount of seconds the request was allowed to take.
+    """
+
+    def __init__(self, msg: str = "", /, *, route: Route | None = None, timeout: float) -> None:
+        self.timeout = timeout
+        super().__init__(msg, route=route, status=408, extra="Request timed out.")
+
+
+class CircuitOpenException(HTTPException):
+    """Exception raised when a request is not sent because the circuit breaker for its route is open.
+
+    The circuit breaker opens when too many recent requests to the same endpoint failed, E.g. during a partial Twitch
+    outage. See the ``circuit_breaker`` parameter of :class:`~twitchio.Client`.
+
+    This exception inherits from :exc:`~twitchio.HTTPException`. The ``status`` is always ``503``.
+
+    Attributes
+    ----------
+    route: :class:`twitchio.Route` | None
+        The :class:`twitchio.Route` of the request which was not sent.
+    status: int
+        Always ``503``.
+    extra: dict[Literal["message"], str]
+        A dict with a single key named "message".
+    retry_after: float
+        The amount of seconds until the circuit breaker allows a trial request to the route.
+    """
+
+    def __init__(self, msg: str = "", /, *, route: Route | None = None, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(msg, route=route, status=503, extra="Circuit breaker is open.")
+
+
 class InvalidTokenException(HTTPException):
     """Exception raised when an token can not be validated or refreshed.
 
@@ -24,19 +24,29 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import array
+import asyncio
+import contextlib
+import contextvars
 import copy
 import datetime
+import inspect
 import logging
 import sys
+import time
 import urllib.parse
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import AsyncIterator, Awaitable, Callable
-from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, Self, TypeAlias, TypeVar, Unpack
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, Self, TypeAlias, TypeVar, Unpack, cast
 
 import aiohttp
 
 from . import __version__
-from .exceptions import HTTPException
+from .backoff import Backoff
+from .breaker import CircuitBreakers, CircuitState
+from .exceptions import CircuitOpenException, HTTPException, HTTPTimeoutException
+from .loader import BatchLoader
+from .metrics import HTTPMetrics, RequestMetrics
 from .models.analytics import ExtensionAnalytics, GameAnalytics
 from .models.bits import ExtensionTransaction
 from .models.channel_points import CustomRewardRedemption
@@ -56,17 +66,30 @@ from .models.search import SearchChannel
 from .models.streams import Stream, VideoMarkers
 from .models.subscriptions import BroadcasterSubscription, BroadcasterSubscriptions
 from .models.videos import Video
+from .ratelimit import RateLimiter, RequestPriority
 from .user import ActiveExtensions, PartialUser
-from .utils import MISSING, Colour, _from_json, date_to_datetime_with_z, handle_user_ids, url_encode_datetime  # type: ignore
+from .utils import (
+    MISSING,
+    Colour,
+    _from_json,  # type: ignore
+    _to_json,  # type: ignore
+    date_to_datetime_with_z,
+    handle_user_ids,
+    url_encode_datetime,
+)
 
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Sequence
+    from collections.abc import Collection, Coroutine, Generator, Iterable, Mapping, Sequence
 
     from .assets import Asset
+    from .breaker import CircuitBreaker
+    from .cache import ResponseCache
     from .eventsub.enums import SubscriptionType
+    from .metrics import RouteStats
     from .models.channel_points import CustomReward
     from .models.moderation import AutomodCheckMessage, AutomodSettings
+    from .ratelimit import RateLimitBucket
     from .types_.conduits import Condition
     from .types_.eventsub import (
         SubscriptionCreateRequest,
@@ -74,7 +97,8 @@ if TYPE_CHECKING:
         SubscriptionResponse,
         _SubscriptionData,
     )
-    from .types_.requests import APIRequestKwargs, HTTPMethod, ParamMapping
+    from .types_.options import CircuitBreakerPolicy, ConnectionPolicy, HedgePolicy
+    from .types_.requests import APIRequestKwargs, HTTPMethod, PaginationCheckpoint, ParamMapping
     from .types_.responses import (
         AddBlockedTermResponse,
         AdScheduleResponse,
@@ -160,19 +184,46 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 T = TypeVar("T")
-PaginatedConverter: TypeAlias = Callable[..., Awaitable[T]] | None
+PaginatedConverter: TypeAlias = Callable[..., Awaitable[T] | T] | None
+RetryHook: TypeAlias = Callable[["Route", int, int], Any]
+CheckpointHook: TypeAlias = Callable[["PaginationCheckpoint"], Any]
+BatchKey: TypeAlias = tuple[str, str]
+BatchResult: TypeAlias = "list[RawResponse] | HTTPException"
+FanOutError: TypeAlias = HTTPException | aiohttp.ClientError | TimeoutError
+
+
+IDEMPOTENT_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("twitchio_request_deadline", default=None)
+
+DEFAULT_HEDGE_POLICY: HedgePolicy = {
+    "delay": None,
+    "percentile": 95,
+    "minimum_samples": 20,
+    "minimum_delay": 0.05,
+    "routes": None,
+}
+
+DEFAULT_CONNECTION_POLICY: ConnectionPolicy = {
+    "limit": 100,
+    "limit_per_host": 0,
+    "keepalive_timeout": 30.0,
+    "ttl_dns_cache": 300,
+    "prewarm": 0,
+}
 
 
 async def json_or_text(resp: aiohttp.ClientResponse) -> dict[str, Any] | str:
-    text: str = await resp.text()
+    body: bytes = await resp.read()
 
     try:
         if resp.headers["Content-Type"].startswith("application/json"):
-            return _from_json(text)  # type: ignore
+            return _from_json(body)  # type: ignore
     except KeyError:
         pass
 
-    return text
+    # The body has already been read, so this only decodes it...
+    return await resp.text()
 
 
 class Route:
@@ -196,18 +247,34 @@ class Route:
         The request method used.
     path: str
         The API endpoint requested.
+    retries: int
+        The maximum amount of times this request will be retried after receiving a ``429`` or, for idempotent methods only,
+        a ``5xx`` response.
+    deadline: float | None
+        An optional :func:`time.monotonic` timestamp by which this request, including any time spent waiting for the rate
+        limit and retrying, must complete. Otherwise :exc:`~twitchio.HTTPTimeoutException` is raised.
+    batch: dict[str, str] | None
+        An optional mapping of query parameter to the response field which identifies each result, E.g. ``{"id": "id"}``.
+        When set, lookups from concurrent ``GET`` requests to the same endpoint are merged into a single request.
+    priority: :class:`~twitchio.ratelimit.RequestPriority`
+        The priority class of this request. When the rate limit bucket for the token is empty or nearly empty, requests
+        with a higher priority are sent first.
     """
 
     __slots__ = (
         "_base_url",
         "_url",
+        "batch",
         "data",
+        "deadline",
         "headers",
         "json",
         "method",
         "packed",
         "params",
         "path",
+        "priority",
+        "retries",
         "token_for",
         "use_id",
     )
@@ -221,6 +288,10 @@ class Route:
         path: str,
         *,
         use_id: bool = False,
+        retries: int = 3,
+        deadline: float | None = None,
+        batch: dict[str, str] | None = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
         **kwargs: Unpack[APIRequestKwargs],
     ) -> None:
         self.params: ParamMapping = kwargs.pop("params", {})
@@ -232,6 +303,11 @@ class Route:
         self.method = method
         self.path = path
 
+        self.retries: int = retries
+        self.deadline: float | None = deadline
+        self.batch: dict[str, str] | None = batch
+        self.priority: RequestPriority = priority
+
         self._base_url: str = ""
         self._url: str = self.build_url(duplicate_key=not use_id)
 
@@ -298,6 +374,44 @@ class Route:
         self.headers.update(headers)
 
 
+class _Column:
+    # A single column built by HTTPAsyncIterator.to_columns. Numbers and bools are kept in a compact array until a value
+    # which does not fit is seen, at which point the column is widened, or falls back to a list...
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        self.values: array.array[Any] | list[Any] | None = None
+
+    @staticmethod
+    def _create(value: Any) -> array.array[Any] | list[Any]:
+        if isinstance(value, bool):
+            return array.array("b")
+        if isinstance(value, int):
+            return array.array("q")
+        if isinstance(value, float):
+            return array.array("d")
+
+        return []
+
+    def append(self, value: Any) -> None:
+        if self.values is None:
+            self.values = self._create(value)
+
+        values: array.array[Any] | list[Any] = self.values
+        if isinstance(values, list):
+            values.append(value)
+            return
+
+        try:
+            values.append(value)
+        except (TypeError, OverflowError):
+            if values.typecode == "q" and isinstance(value, float):
+                self.values = array.array("d", values)
+                self.values.append(value)
+            else:
+                self.values = [*values, value]
+
+
 class HTTPAsyncIterator(Generic[T]):
     """TwitchIO async iterator for HTTP requests.
 
@@ -337,21 +451,55 @@ class HTTPAsyncIterator(Generic[T]):
             ...
             break
 
+        # Fetch up to 2 pages ahead while the current page is being processed...
+        async for item in bot.fetch_streams(first=100, max_results=1000).prefetch(2):
+            ...
+
+        # Only keep the fields needed from the data Twitch returned, without building models...
+        viewers = [stream["viewer_count"] async for stream in bot.fetch_streams(max_results=1000).raw()]
+
+        # Receive a whole page at a time instead of each item...
+        async for page in bot.fetch_streams(max_results=1000).pages():
+            ...
+
+    When ``max_results`` is set, ``first`` is raised to the largest page size the endpoint allows, and the final page only
+    requests the amount of results remaining.
+
 
     .. important::
 
         Everything in this class is private internals, and should not be modified.
     """
 
+    FIRST_LIMITS: ClassVar[dict[str, int]] = {
+        "channel_points/custom_rewards/redemptions": 50,
+        "chat/chatters": 1000,
+        "entitlements/drops": 1000,
+        "polls": 20,
+        "predictions": 25,
+        "schedule": 25,
+    }
+
     __slots__ = (
+        "_async_converter",
         "_buffer",
+        "_checkpoint",
+        "_checkpoint_every",
+        "_checkpoint_hook",
+        "_consumed",
         "_converter",
         "_cursor",
+        "_fetched",
         "_first",
+        "_first_key",
+        "_handed",
         "_http",
         "_max_results",
         "_nested_key",
+        "_pages",
+        "_prefetch",
         "_route",
+        "_states",
     )
 
     def __init__(
@@ -361,67 +509,401 @@ class HTTPAsyncIterator(Generic[T]):
         max_results: int | None = None,
         converter: PaginatedConverter[T] = None,
         nested_key: str | None = None,
+        prefetch: int = 0,
     ) -> None:
         self._http = http
         self._route = route
 
         self._cursor: str | None | bool = None
-        self._first: int = int(route.params.get("first", 20))  # 20 is twitch default
+        self._first_key: str = "First" if "First" in route.params else "first"
+        self._first: int = int(route.params.get(self._first_key, 20))  # 20 is twitch default
         self._max_results: int | None = max_results
 
-        if self._max_results is not None and self._max_results < self._first:
-            self._first = self._max_results
+        if self._max_results is not None and nested_key is None and self._first_key in route.params:
+            # Request as few pages as possible when the caller wants more results than fit on a single page...
+            cap: int = self.FIRST_LIMITS.get(route.path.strip("/"), 100)
+            self._first = max(self._first, min(cap, self._max_results))
 
-        self._converter = converter or self._base_converter
+        self._converter: Callable[..., Awaitable[T] | T] = converter or self._base_converter
+        self._async_converter: bool = inspect.iscoroutinefunction(self._converter)
         self._buffer: deque[T] = deque()
         self._nested_key: str | None = nested_key
 
-    async def _base_converter(self, data: Any, *, raw: Any = None) -> T:
-        if raw is None:
-            raw = {}
-
+        self._prefetch: int = max(prefetch, 0)
+        self._pages: deque[asyncio.Task[list[T] | None]] = deque()
+
+        # The (cursor, max_results) after each fetched page, handed over as pages are consumed so a checkpoint never skips
+        # items which were fetched, or prefetched, but not yet consumed...
+        self._states: deque[tuple[str | bool | None, int | None]] = deque()
+        self._handed: tuple[str | bool | None, int | None] | None = None
+        self._checkpoint: tuple[str | bool | None, int | None] = (None, max_results)
+        self._checkpoint_hook: CheckpointHook | None = None
+        self._checkpoint_every: int = 1
+        self._consumed: int = 0
+        self._fetched: int = 0
+
+    @staticmethod
+    def _base_converter(data: Any, *, raw: Any = None) -> Any:
+        # A staticmethod so storing it as the converter does not create a reference cycle with the iterator...
         return data
 
-    async def _call_next(self) -> None:
+    def prefetch(self, depth: int = 1) -> Self:
+        """Set how many pages this iterator should request ahead of the page currently being consumed.
+
+        Pages are still requested in order, but the request for the next page is made while the items of the current page
+        are being processed. At most ``depth`` pages are held in memory ahead of the current page.
+
+        Parameters
+        ----------
+        depth: int
+            The amount of pages to fetch ahead. ``0`` disables prefetching. Defaults to ``1``.
+
+        Returns
+        -------
+        HTTPAsyncIterator
+            This iterator, to allow chaining.
+        """
+        self._prefetch = max(depth, 0)
+        return self
+
+    def checkpoint(self) -> PaginationCheckpoint:
+        """Return a checkpoint of this iterator which can be saved and later passed to :meth:`resume`.
+
+        The checkpoint points just after the last page which was fully consumed. Items which have been fetched but not yet
+        consumed are fetched again when resuming. The checkpoint is a ``dict`` which can be serialised to JSON.
+
+        Returns
+        -------
+        dict[str, Any]
+            A mapping of ``"path"``, the endpoint being paginated, ``"cursor"``, the pagination cursor, and
+            ``"max_results"``, the amount of results remaining or ``None``.
+        """
+        cursor, max_results = self._checkpoint
+        return {"path": self._route.path, "cursor": cursor, "max_results": max_results}
+
+    def resume(self, checkpoint: PaginationCheckpoint) -> Self:
+        """Continue from a checkpoint previously returned by :meth:`checkpoint` instead of from the first page.
+
+        The iterator must be created by calling the same method, with the same arguments, as the iterator the checkpoint
+        was taken from. This must be called before any results are fetched.
+
+        Parameters
+        ----------
+        checkpoint: dict[str, Any]
+            The checkpoint to resume from.
+
+        Raises
+        ------
+        ValueError
+            The checkpoint was taken from an iterator for a different endpoint.
+        RuntimeError
+            Results have already been fetched with this iterator.
+
+        Returns
+        -------
+        HTTPAsyncIterator
+            This iterator, to allow chaining.
+        """
+        if self._fetched:
+            raise RuntimeError("resume() must be called before any results are fetched.")
+
+        if checkpoint["path"] != self._route.path:
+            raise ValueError(f'Checkpoint is for "{checkpoint["path"]}", not "{self._route.path}".')
+
+        self._cursor = checkpoint["cursor"]
+        self._max_results = checkpoint["max_results"]
+        self._checkpoint = (self._cursor, self._max_results)
+
+        return self
+
+    def checkpoints(self, callback: CheckpointHook, *, every: int = 1) -> Self:
+        """Call ``callback`` with a new :meth:`checkpoint` after every ``every`` pages have been consumed.
+
+        The callback can be a function or a coroutine function. Coroutines are awaited before the next page is consumed.
+
+        Parameters
+        ----------
+        callback: Callable[[dict[str, Any]], Any]
+            The callable to receive each checkpoint.
+        every: int
+            The amount of pages to consume between each call. Defaults to ``1``.
+
+        Returns
+        -------
+        HTTPAsyncIterator
+            This iterator, to allow chaining.
+
+        Examples
+        --------
+
+        .. code-block:: python3
+
+            async def save(checkpoint: dict[str, Any]) -> None:
+                await database.store("followers-export", checkpoint)
+
+            iterator = user.fetch_followers(max_results=100_000).checkpoints(save, every=10)
+
+            if saved := await database.load("followers-export"):
+                iterator.resume(saved)
+
+            async for follower in iterator:
+                ...
+        """
+        self._checkpoint_hook = callback
+        self._checkpoint_every = max(every, 1)
+
+        return self
+
+    def _hand(self) -> None:
+        # Called as a page is handed to the consumer...
+        self._handed = self._states.popleft() if self._states else None
+
+    async def _consumed_page(self) -> None:
+        # Called once the page handed to the consumer has been fully consumed...
+        if self._handed is None:
+            return
+
+        self._checkpoint, self._handed = self._handed, None
+        self._consumed += 1
+
+        if self._checkpoint_hook is None or self._consumed % self._checkpoint_every:
+            return
+
+        result: Any = self._checkpoint_hook(self.checkpoint())
+        if inspect.isawaitable(result):
+            await result
+
+    def timeout(self, seconds: float) -> Self:
+        """Set a deadline for fetching every page of this iterator, starting from when this method is called.
+
+        Once the deadline passes, the request being made is cancelled and :exc:`~twitchio.HTTPTimeoutException` is
+        raised. Items from pages which were already fetched can still be consumed.
+
+        Parameters
+        ----------
+        seconds: float
+            The amount of seconds all pages must be fetched within.
+
+        Returns
+        -------
+        HTTPAsyncIterator
+            This iterator, to allow chaining.
+        """
+        deadline: float = time.monotonic() + seconds
+        self._route.deadline = deadline if self._route.deadline is None else min(self._route.deadline, deadline)
+
+        return self
+
+    def raw(self) -> HTTPAsyncIterator[Any]:
+        """Skip building models and yield the data returned by Twitch for each item instead.
+
+        Each item is the ``dict`` described by the matching ``TypedDict`` in ``twitchio.types_.responses``, E.g.
+        ``StreamsResponseData`` for :meth:`~twitchio.Client.fetch_streams`. This avoids creating objects such as
+        :class:`~twitchio.PartialUser` and parsing timestamps, which is useful when only a few fields of many results are
+        needed.
+
+        This must be called before any results are fetched.
+
+        Returns
+        -------
+        HTTPAsyncIterator
+            This iterator, to allow chaining.
+        """
+        if self._fetched:
+            raise RuntimeError("raw() must be called before any results are fetched.")
+
+        self._converter = self._base_converter
+        self._async_converter = False
+
+        return cast("HTTPAsyncIterator[Any]", self)
+
+    async def _fetch_page(self) -> list[T] | None:
         if self._cursor is False:
-            raise StopAsyncIteration
+            return None
 
         if self._max_results is not None and self._max_results <= 0:
-            raise StopAsyncIteration
+            return None
+
+        # Only the first page is treated as interactive, later pages are background work...
+        if self._cursor and self._route.priority == RequestPriority.NORMAL:
+            self._route.priority = RequestPriority.LOW
 
-        self._route.update_params({"after": self._cursor})
+        first: int = self._first if self._max_results is None else min(self._first, self._max_results)
+        params: dict[str, Any] = {"after": self._cursor}
+
+        if self._first_key in self._route.params:
+            params[self._first_key] = first
+
+        self._route.update_params(params)
         data: RawResponse = await self._http.request_json(self._route)
         self._cursor = data.get("pagination", {}).get("cursor", False)
+        self._fetched += 1
 
         try:
             inner: list[RawResponse] = data["data"] if self._nested_key is None else data["data"][self._nested_key]
         except KeyError as e:
             raise HTTPException('Expected "data" key not found.', route=self._route, status=500, extra="") from e
 
-        if not self._nested_key:
-            for value in inner:
-                if self._max_results is None:
-                    self._buffer.append(await self._do_conversion(value, raw=data))
-                    continue
+        # Nested responses, E.g. the schedule, are treated as a single result per page...
+        values: list[RawResponse] = inner if self._nested_key is None else inner[:1]
 
-                self._max_results -= 1  # If this is causing issues, it's just pylance bugged/desynced...
-                if self._max_results < 0:
-                    return
+        if self._max_results is not None:
+            values = values[: self._max_results]
+            self._max_results -= len(values)
 
-                self._buffer.append(await self._do_conversion(value, raw=data))
-        else:
-            if self._max_results is not None:
-                self._max_results -= 1  # If this is causing issues, it's just pylance bugged/desynced...
-                if self._max_results < 0:
-                    return
-            self._buffer.append(await self._do_conversion(inner[0], raw=data))
+        self._states.append((self._cursor, self._max_results))
+
+        if self._converter == self._base_converter:
+            return list(values)  # type: ignore[arg-type]
+
+        if self._async_converter:
+            return [await self._do_conversion(value, raw=data) for value in values]
+
+        return [self._converter(value, raw=data) for value in values]  # type: ignore[misc]
+
+    async def _fetch_page_after(self, previous: asyncio.Task[list[T] | None] | None) -> list[T] | None:
+        # Each page depends on the cursor of the page before it, so prefetched pages are chained in order...
+        if previous is not None and await asyncio.shield(previous) is None:
+            return None
+
+        return await self._fetch_page()
+
+    async def _next_prefetched(self) -> list[T] | None:
+        if not self._pages:
+            self._pages.append(asyncio.create_task(self._fetch_page_after(None)))
+
+        task: asyncio.Task[list[T] | None] = self._pages.popleft()
+
+        while len(self._pages) < self._prefetch:
+            previous: asyncio.Task[list[T] | None] = self._pages[-1] if self._pages else task
+            self._pages.append(asyncio.create_task(self._fetch_page_after(previous)))
+
+        return await task
+
+    async def _call_next(self) -> None:
+        await self._consumed_page()
+
+        page: list[T] | None = await self._next_prefetched() if self._prefetch else await self._fetch_page()
+        if page is None:
+            raise StopAsyncIteration
+
+        self._hand()
+        self._buffer.extend(page)
 
     async def _do_conversion(self, data: RawResponse, *, raw: RawResponse) -> T:
-        return await self._converter(data, raw=raw)
+        result: Awaitable[T] | T = self._converter(data, raw=raw)
+        return await result if inspect.isawaitable(result) else result  # type: ignore[return-value]
+
+    async def aclose(self) -> None:
+        """|coro|
+
+        Stop this iterator and cancel any pages still being fetched in the background, E.g. by :meth:`prefetch`.
+
+        Breaking out of ``async for`` does not stop background requests by itself. Call this, or wrap the iterator with
+        :func:`contextlib.aclosing`, when not every result will be consumed.
+        """
+        self._cursor = False
+
+        tasks: list[asyncio.Task[list[T] | None]] = list(self._pages)
+        self._pages.clear()
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def pages(self) -> AsyncIterator[list[T]]:
+        """An async iterator which yields each page of results as a :class:`list`, instead of one item at a time.
+
+        Any items already consumed with ``async for`` are not returned again. Pages are still requested ahead of time when
+        :meth:`prefetch` has been set.
+
+        Yields
+        ------
+        list[T]
+            The converted results of a single page.
+        """
+        if self._buffer:
+            yield list(self._buffer)
+            self._buffer.clear()
+
+        while True:
+            await self._consumed_page()
+
+            page: list[T] | None = await self._next_prefetched() if self._prefetch else await self._fetch_page()
+            if page is None:
+                return
+
+            self._hand()
+
+            if page:
+                yield page
+
+    async def to_columns(self, fields: Sequence[str], *, numpy: bool = False) -> dict[str, Any]:
+        """|coro|
+
+        Fetch every result and collect the requested fields into columns, instead of creating an object for each result.
+
+        Fields are keys of the data returned by Twitch, E.g. ``"viewer_count"`` for streams or ``"view_count"`` and
+        ``"duration"`` for clips. Columns of numbers or bools are stored in a compact :class:`array.array`, and every other
+        column, or a column with missing values, is stored in a :class:`list`. Results are read one page at a time, so only
+        the columns are kept in memory.
+
+        This uses :meth:`raw` and must be called before any results are fetched.
+
+        Parameters
+        ----------
+        fields: Sequence[str]
+            The fields to collect.
+        numpy: bool
+            Whether to convert the :class:`array.array` columns to NumPy arrays. Requires NumPy, which can be installed with
+            ``pip install twitchio[numpy]``. Defaults to ``False``.
+
+        Raises
+        ------
+        RuntimeError
+            ``numpy`` was set but NumPy is not installed.
+
+        Returns
+        -------
+        dict[str, array.array | list | numpy.ndarray]
+            A mapping of field to column. Every column has one value per result.
+
+        Examples
+        --------
+
+        .. code-block:: python3
+
+            columns = await bot.fetch_streams(max_results=10_000).to_columns(["user_login", "viewer_count"])
+            total = sum(columns["viewer_count"])
+        """
+        np: Any = None
+
+        if numpy:
+            try:
+                import numpy as np  # type: ignore
+            except ImportError as e:
+                raise RuntimeError("NumPy is not installed. Please install it with: 'pip install twitchio[numpy]'.") from e
+
+        columns: dict[str, _Column] = {field: _Column() for field in fields}
+
+        async for page in self.raw().pages():
+            for item in page:
+                for field, column in columns.items():
+                    column.append(item.get(field))
+
+        results: dict[str, Any] = {}
+        for field, column in columns.items():
+            values: array.array[Any] | list[Any] = column.values if column.values is not None else []
+            results[field] = np.asarray(values) if np is not None and isinstance(values, array.array) else values
+
+        return results
 
     async def _flatten(self) -> list[T]:
+        # Only the first page is returned when awaited, so there is no reason to prefetch...
         if not self._buffer:
-            await self._call_next()
+            self._buffer.extend(await self._fetch_page() or [])
+            self._hand()
 
         return list(self._buffer)
 
@@ -443,15 +925,238 @@ class HTTPAsyncIterator(Generic[T]):
         return data
 
 
+class HTTPMergedAsyncIterator(HTTPAsyncIterator[T]):
+    """An :class:`HTTPAsyncIterator` which paginates several routes concurrently and merges their results.
+
+    Used to split a single large query, E.g. clips over a long date range, into multiple smaller queries which can be
+    paginated at the same time. Results are yielded in the order pages arrive, not in the order of each route, and items
+    returned by more than one route are only yielded once.
+
+    Each route is paginated in a background task. The tasks are cancelled once every result has been consumed, when
+    :meth:`aclose` is called, or when the iterator is garbage collected.
+
+    Merged iterators do not support :meth:`checkpoint`, :meth:`resume` or :meth:`checkpoints`, as several cursors are
+    paginated at once.
+
+    .. important::
+
+        Everything in this class is private internals, and should not be modified.
+    """
+
+    __slots__ = ("_finished", "_iterators", "_key", "_queue", "_seen", "_tasks")
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        iterators: list[HTTPAsyncIterator[Any]],
+        max_results: int | None = None,
+        converter: PaginatedConverter[T] = None,
+        *,
+        key: str = "id",
+    ) -> None:
+        super().__init__(http, iterators[0]._route, max_results, converter=converter)
+
+        self._iterators: list[HTTPAsyncIterator[Any]] = iterators
+        self._key: str = key
+        self._seen: set[Any] = set()
+        self._finished: int = 0
+
+        # Bounded so windows can not run far ahead of the consumer...
+        self._queue: asyncio.Queue[list[Any] | BaseException | None] = asyncio.Queue(maxsize=len(iterators) * 2)
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def __del__(self) -> None:
+        # The consumer tasks do not reference this iterator, so it is collected as soon as the caller drops it, E.g. after
+        # breaking out of async for. Without this the tasks would wait on the full queue forever...
+        with contextlib.suppress(AttributeError, RuntimeError):
+            self._cancel()
+
+    def timeout(self, seconds: float) -> Self:
+        for iterator in self._iterators:
+            iterator.timeout(seconds)
+
+        return super().timeout(seconds)
+
+    def checkpoint(self) -> PaginationCheckpoint:
+        """Not supported by merged iterators.
+
+        Raises
+        ------
+        TypeError
+            Merged iterators paginate several cursors at once and can not be checkpointed.
+        """
+        raise TypeError("Merged iterators paginate several cursors at once and can not be checkpointed.")
+
+    def resume(self, checkpoint: PaginationCheckpoint) -> Self:
+        """Not supported by merged iterators.
+
+        Raises
+        ------
+        TypeError
+            Merged iterators paginate several cursors at once and can not be resumed.
+        """
+        raise TypeError("Merged iterators paginate several cursors at once and can not be resumed.")
+
+    def checkpoints(self, callback: CheckpointHook, *, every: int = 1) -> Self:
+        """Not supported by merged iterators.
+
+        Raises
+        ------
+        TypeError
+            Merged iterators paginate several cursors at once and can not be checkpointed.
+        """
+        raise TypeError("Merged iterators paginate several cursors at once and can not be checkpointed.")
+
+    async def aclose(self) -> None:
+        """|coro|
+
+        Stop this iterator and cancel the background tasks paginating each route.
+        """
+        tasks: list[asyncio.Task[None]] = self._tasks
+        self._cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _consume(queue: asyncio.Queue[list[Any] | BaseException | None], iterator: HTTPAsyncIterator[Any]) -> None:
+        # A staticmethod so the task holds no reference to the merged iterator, see __del__...
+        try:
+            async for page in iterator.raw().pages():
+                await queue.put(page)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+
+        await queue.put(None)
+
+    def _cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        self._tasks = []
+        self._cursor = False
+
+    async def _fetch_page(self) -> list[T] | None:
+        if self._cursor is False:
+            return None
+
+        if self._max_results is not None and self._max_results <= 0:
+            self._cancel()
+            return None
+
+        if self._cursor is None:
+            self._cursor = True
+            self._fetched += 1
+            self._tasks = [asyncio.create_task(self._consume(self._queue, iterator)) for iterator in self._iterators]
+
+        while True:
+            page: list[Any] | BaseException | None = await self._queue.get()
+
+            if page is None:
+                self._finished += 1
+                if self._finished >= len(self._iterators):
+                    self._cursor = False
+                    return None
+
+                continue
+
+            if isinstance(page, BaseException):
+                self._cancel()
+                raise page
+
+            values: list[Any] = []
+            for value in page:
+                key: Any = value.get(self._key)
+                if key is not None and key in self._seen:
+                    continue
+
+                self._seen.add(key)
+                values.append(value)
+
+            if not values:
+                continue
+
+            if self._max_results is not None:
+                values = values[: self._max_results]
+                self._max_results -= len(values)
+
+            if self._converter == self._base_converter:
+                return values
+
+            if self._async_converter:
+                return [await self._do_conversion(value, raw={}) for value in values]
+
+            return [self._converter(value, raw={}) for value in values]  # type: ignore[misc]
+
+
 class HTTPClient:
-    __slots__ = ("_client_id", "_session", "_session_set", "_should_close", "user_agent")
+    FANOUT_LIMIT: ClassVar[int] = 8
+    LOADER_LIMIT: ClassVar[int] = 256
 
-    def __init__(self, session: aiohttp.ClientSession = MISSING, *, client_id: str) -> None:
+    __slots__ = (
+        "_cache",
+        "_client_id",
+        "_connection_policy",
+        "_fanout",
+        "_hedging",
+        "_inflight",
+        "_loaders",
+        "_ratelimiter",
+        "_session",
+        "_session_set",
+        "_should_close",
+        "_ws_session",
+        "breakers",
+        "hedged",
+        "metrics",
+        "retried",
+        "retry_hook",
+        "timeout",
+        "user_agent",
+    )
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession = MISSING,
+        *,
+        client_id: str,
+        cache: ResponseCache | None = None,
+        connection_policy: ConnectionPolicy | None = None,
+        timeout: float | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        hedging: HedgePolicy | None = None,
+    ) -> None:
         self._session: aiohttp.ClientSession = session
         self._should_close: bool = session is MISSING
         self._session_set: bool = False
 
+        self._connection_policy: ConnectionPolicy = {**DEFAULT_CONNECTION_POLICY, **(connection_policy or {})}
+        self._ws_session: aiohttp.ClientSession | None = None
+
         self._client_id: str = client_id
+        self._ratelimiter: RateLimiter = RateLimiter()
+        self._inflight: dict[tuple[str, str], asyncio.Task[RawResponse | str | None]] = {}
+        self._cache: ResponseCache | None = cache
+        self._loaders: OrderedDict[tuple[Any, ...], BatchLoader[BatchKey, BatchResult]] = OrderedDict()
+        self._fanout: asyncio.Semaphore = asyncio.Semaphore(self.FANOUT_LIMIT)
+
+        # The default amount of seconds a request may take, including rate limit waits and retries...
+        self.timeout: float | None = timeout
+
+        # Per-route latency and status statistics, see HTTPMetrics...
+        self.metrics: HTTPMetrics = HTTPMetrics()
+
+        # Optional per-route circuit breakers which fail requests fast while an endpoint is failing...
+        self.breakers: CircuitBreakers | None = None if circuit_breaker is None else CircuitBreakers(circuit_breaker)
+
+        # Optional hedging of slow GET requests, and the total amount of hedged requests sent...
+        self._hedging: HedgePolicy | None = None if hedging is None else {**DEFAULT_HEDGE_POLICY, **hedging}
+        self.hedged: int = 0
+
+        # The total amount of retries made and an optional callback called with (route, status, attempt) on each retry...
+        self.retried: int = 0
+        self.retry_hook: RetryHook | None = None
 
         # User Agent...
         pyver = f"{sys.version_info[0]}.{sys.version_info[1]}"
@@ -475,7 +1180,69 @@ class HTTPClient:
             return
 
         logger.debug("Initialising ClientSession on %s.", self.__class__.__qualname__)
-        self._session = aiohttp.ClientSession(headers=self.headers)
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=self._create_connector(),
+            trace_configs=[self.metrics.trace_config()],
+        )
+
+    def _create_connector(self, *, websocket: bool = False) -> aiohttp.TCPConnector:
+        policy: ConnectionPolicy = self._connection_policy
+
+        # Websockets hold their connection for their whole lifetime, so they are never limited or kept alive by the pool...
+        if websocket:
+            return aiohttp.TCPConnector(limit=0, ttl_dns_cache=policy.get("ttl_dns_cache"))
+
+        return aiohttp.TCPConnector(
+            limit=policy.get("limit", 100),
+            limit_per_host=policy.get("limit_per_host", 0),
+            keepalive_timeout=policy.get("keepalive_timeout", 30.0),
+            ttl_dns_cache=policy.get("ttl_dns_cache"),
+        )
+
+    async def prewarm(self, count: int | None = None) -> int:
+        """Open connections to Helix ahead of time so the first requests do not pay for DNS and TLS handshakes.
+
+        The connections are returned to the pool and reused by later requests for as long as the ``keepalive_timeout`` of
+        the connection policy allows.
+
+        Parameters
+        ----------
+        count: int | None
+            The amount of connections to open. Defaults to the ``prewarm`` value of the connection policy.
+
+        Returns
+        -------
+        int
+            The amount of connections which were opened successfully.
+        """
+        count = self._connection_policy.get("prewarm", 0) if count is None else count
+        if count <= 0:
+            return 0
+
+        await self._init_session()
+
+        async def warm() -> bool:
+            try:
+                async with self._session.head(Route.BASE) as resp:
+                    await resp.read()
+            except (TimeoutError, aiohttp.ClientError) as e:
+                logger.debug("Unable to pre-warm a connection on %s: %s", self.__class__.__qualname__, e)
+                return False
+
+            return True
+
+        opened: int = sum(await asyncio.gather(*(warm() for _ in range(count))))
+        logger.debug("Pre-warmed %d of %d connections on %s.", opened, count, self.__class__.__qualname__)
+
+        return opened
+
+    async def ws_connect(self, url: str, *, heartbeat: float | None = None) -> aiohttp.ClientWebSocketResponse:
+        # Every websocket shares one session so DNS results and the TLS context are reused between connections...
+        if self._ws_session is None or self._ws_session.closed:
+            self._ws_session = aiohttp.ClientSession(connector=self._create_connector(websocket=True))
+
+        return await self._ws_session.ws_connect(url, heartbeat=heartbeat)
 
     def clear(self) -> None:
         if self._session and self._session.closed:
@@ -486,6 +1253,11 @@ class HTTPClient:
             self._session_set = False
 
     async def close(self) -> None:
+        if self._ws_session and not self._ws_session.closed:
+            await self._ws_session.close()
+
+        self._ws_session = None
+
         if not self._should_close:
             return
 
@@ -498,6 +1270,248 @@ class HTTPClient:
             self.clear()
             logger.debug("%s session closed successfully.", self.__class__.__qualname__)
 
+    def _bucket_key(self, route: Route) -> str:
+        # Helix rate limits are tracked per token, so each distinct Authorization header gets its own bucket...
+        return route.headers.get("Authorization", "")
+
+    def _should_retry(self, route: Route, status: int, attempts: int) -> bool:
+        if attempts >= route.retries:
+            return False
+
+        # Twitch does not process requests which were rate limited, so these are always safe to send again...
+        if status == 429:
+            return True
+
+        return status >= 500 and route.method in IDEMPOTENT_METHODS
+
+    async def fan_out(
+        self, calls: Iterable[Callable[[], Awaitable[T]]], *, concurrency: int = FANOUT_LIMIT
+    ) -> list[T | FanOutError]:
+        # Runs each call with at most `concurrency` in flight. The rate limit bucket still decides when each request is sent,
+        # and a failed call, including connection errors and timeouts, is returned in place of its result so one failure
+        # does not stop the rest...
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def run(call: Callable[[], Awaitable[T]]) -> T | FanOutError:
+            async with semaphore:
+                try:
+                    return await call()
+                except (HTTPException, aiohttp.ClientError, TimeoutError) as e:
+                    return e
+
+        return await asyncio.gather(*(run(call) for call in calls))
+
+    async def _send(
+        self, route: Route, bucket: RateLimitBucket | None, breaker: CircuitBreaker | None = None, ticket: int = 0
+    ) -> RawResponse | str | None:
+        assert self._session is not None
+
+        started: float = time.perf_counter()
+
+        if bucket:
+            try:
+                await bucket.acquire(route.priority)
+            except asyncio.CancelledError:
+                # Give up a half-open trial slot we may be holding so another request can take it...
+                if breaker:
+                    breaker.record(ticket, None)
+
+                raise
+
+        queue_wait: float = time.perf_counter() - started
+        timings: dict[str, float] = {}
+        status: int = 0
+        size: int = 0
+        failed: bool | None = None
+        cancelled: bool = False
+
+        headers: Mapping[str, str] | None = None
+        request_headers: dict[str, str] = route.headers
+        body: bytes | None = None
+
+        if route.json:
+            body = _to_json(route.json)
+            request_headers = {**route.headers, "Content-Type": "application/json"}
+
+        try:
+            async with self._session.request(
+                route.method,
+                route.url,
+                headers=request_headers,
+                data=body,
+                trace_request_ctx=timings,
+            ) as resp:
+                headers = resp.headers
+                status = resp.status
+                failed = status >= 500
+                data: RawResponse | str = await json_or_text(resp)
+                size = len(await resp.read())
+
+                logger.debug("Request to %r with %s returned: status=%d", route, self.__class__.__qualname__, resp.status)
+
+                if resp.status >= 400:
+                    raise HTTPException(
+                        f"Request {route} failed with status {resp.status}: {data}",
+                        route=route,
+                        status=resp.status,
+                        extra=data,
+                    )
+
+                if resp.status == 204:
+                    return None
+        except (TimeoutError, aiohttp.ClientError):
+            failed = True
+            raise
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if bucket:
+                bucket.release(headers)
+
+            if breaker:
+                breaker.record(ticket, failed)
+
+            # A cancelled attempt, E.g. the losing request of a hedged pair, says nothing about the endpoint. Recording it
+            # would count it as an error and skew the latency percentiles used to decide when to hedge...
+            if cancelled:
+                self.metrics.record_cancelled(route.method, route.path)
+            else:
+                self.metrics.record(
+                    RequestMetrics(
+                        method=route.method,
+                        path=route.path,
+                        status=status,
+                        bytes=size,
+                        queue_wait=queue_wait,
+                        connect=timings.get("connect", 0.0),
+                        latency=time.perf_counter() - started,
+                    )
+                )
+
+        return data
+
+    def _hedge_delay(self, route: Route) -> float | None:
+        policy: HedgePolicy | None = self._hedging
+        if policy is None or route.method != "GET" or route.use_id:
+            return None
+
+        routes: Collection[str] | None = policy.get("routes")
+        if routes is not None and route.path not in routes:
+            return None
+
+        delay: float | None = policy.get("delay")
+        if delay is None:
+            # Without enough samples the percentile says nothing useful about what a slow response is...
+            stats: RouteStats | None = self.metrics.get(route.method, route.path)
+            if stats is None or stats.count < policy.get("minimum_samples", 20):
+                return None
+
+            delay = stats.percentile(policy.get("percentile", 95))
+
+        return max(delay, policy.get("minimum_delay", 0.05))
+
+    @staticmethod
+    def _can_hedge(bucket: RateLimitBucket | None, breaker: CircuitBreaker | None) -> bool:
+        # A hedge is only worth its extra rate limit point when it can be sent straight away. A half-open breaker only
+        # allows a single trial request...
+        if breaker and breaker.state is not CircuitState.CLOSED:
+            return False
+
+        return bucket is None or (not bucket.queued and bucket.remaining > bucket.reserve)
+
+    async def _send_hedged(
+        self, route: Route, bucket: RateLimitBucket | None, breaker: CircuitBreaker | None, ticket: int, delay: float
+    ) -> RawResponse | str | None:
+        tasks: list[asyncio.Task[RawResponse | str | None]] = [
+            asyncio.create_task(self._send(route, bucket, breaker, ticket))
+        ]
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._can_hedge(bucket, breaker):
+                return await tasks[0]
+
+            self.hedged += 1
+            logger.debug(
+                "Request to %r with %s took longer than %.3f seconds. Sending a hedged request.",
+                route,
+                self.__class__.__qualname__,
+                delay,
+            )
+
+            # The hedge takes its own point from the rate limit bucket...
+            tasks.append(asyncio.create_task(self._send(route, bucket, breaker, ticket)))
+
+            pending: set[asyncio.Task[RawResponse | str | None]] = set(tasks)
+            error: BaseException | None = None
+
+            # The first successful response wins. An error only wins once both requests have failed...
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    exc: BaseException | None = task.exception()
+                    if exc is None:
+                        return task.result()
+
+                    error = error or exc
+
+            assert error is not None
+            raise error
+        finally:
+            # The losing attempt is cancelled, or its error retrieved when it failed before the winner completed...
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def deadline(timeout: float) -> Generator[None, None, None]:
+        # Every request made inside this context must complete within timeout seconds of entering it. Nested contexts
+        # can only shorten the deadline...
+        current: float | None = _deadline.get()
+        deadline: float = time.monotonic() + timeout
+        token = _deadline.set(deadline if current is None else min(current, deadline))
+
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    def _resolve_deadline(self, route: Route) -> float | None:
+        # Only deadlines set explicitly are stored on the Route. The client wide timeout is applied per call, as the same
+        # Route is reused for every page of a paginated request...
+        deadlines: list[float] = [d for d in (route.deadline, _deadline.get()) if d is not None]
+        if self.timeout is not None:
+            deadlines.append(time.monotonic() + self.timeout)
+
+        return min(deadlines) if deadlines else None
+
+    async def _within(self, route: Route, deadline: float | None, coro: Coroutine[Any, Any, T]) -> T:
+        if deadline is None:
+            return await coro
+
+        remaining: float = deadline - time.monotonic()
+        scope: asyncio.Timeout = asyncio.timeout(max(remaining, 0.0))
+
+        try:
+            async with scope:
+                return await coro
+        except TimeoutError as e:
+            # Timeouts raised by aiohttp itself are not ours to translate...
+            if not scope.expired():
+                raise
+
+            logger.debug(
+                "Request to %r with %s timed out after %.2f seconds.", route, self.__class__.__qualname__, remaining
+            )
+            raise HTTPTimeoutException(
+                f"Request {route} did not complete within {remaining:.2f} seconds.", route=route, timeout=remaining
+            ) from e
+
     async def request(self, route: Route) -> RawResponse | str | None:
         if not self._session_set:
             await self._init_session()
@@ -507,28 +1521,246 @@ class HTTPClient:
         logger.debug("Attempting a request to %r with %s.", route, self.__class__.__qualname__)
         route.headers.update(self.headers)
 
-        async with self._session.request(
-            route.method,
-            route.url,
-            headers=route.headers,
-            json=route.json or None,
-        ) as resp:
-            data: RawResponse | str = await json_or_text(resp)
+        # The effective deadline is carried in the context for the rest of this call, so retries and shared requests
+        # made on behalf of it see the same deadline...
+        deadline: float | None = self._resolve_deadline(route)
+        token = _deadline.set(deadline)
+
+        try:
+            return await self._within(route, deadline, self._dispatch(route))
+        finally:
+            _deadline.reset(token)
+
+    async def _dispatch(self, route: Route) -> RawResponse | str | None:
+        if route.method != "GET":
+            return await self._request(route)
+
+        key: tuple[str, str] = (route.url, route.headers.get("Authorization", ""))
+        cache: ResponseCache | None = None if route.use_id else self._cache
+
+        if cache is not None:
+            cached: RawResponse | str | None = cache.get(route.path, key)
+            if cached is not None:
+                logger.debug("Request to %r was answered from the response cache.", route)
+                return cached
+
+        if route.batch:
+            data: RawResponse = await self._load_batched(route)
+
+            if cache is not None:
+                cache.set(route.path, key, data)
+
+            return data
+
+        # Identical GET requests made with the same token share a single in-flight request...
+        task: asyncio.Task[RawResponse | str | None] | None = self._inflight.get(key)
 
-            logger.debug("Request to %r with %s returned: status=%d", route, self.__class__.__qualname__, resp.status)
+        if task is None:
+            # The shared request keeps the deadline of the caller who started it, even if that caller stops waiting...
+            task = asyncio.create_task(self._within(route, _deadline.get(), self._request(route)))
+            self._inflight[key] = task
 
-            if resp.status >= 400:
-                raise HTTPException(
-                    f"Request {route} failed with status {resp.status}: {data}",
+            def remove(done: asyncio.Task[RawResponse | str | None]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+                # Always retrieve the exception, as every caller may have stopped waiting on the shared request...
+                if done.cancelled() or done.exception() is not None:
+                    return
+
+                if cache is not None:
+                    cache.set(route.path, key, done.result())
+
+            task.add_done_callback(remove)
+        else:
+            logger.debug("Joining an identical in-flight request to %r with %s.", route, self.__class__.__qualname__)
+
+        # Shield the shared request so one caller being cancelled does not cancel it for every other caller...
+        return await asyncio.shield(task)
+
+    async def _load_batched(self, route: Route) -> RawResponse:
+        assert route.batch
+
+        keys: list[BatchKey] = []
+        for param in route.batch:
+            value: Any = route.params.get(param)
+            values: list[Any] = [] if value is None else [value] if isinstance(value, (str, int)) else list(value)
+
+            keys.extend((param, str(v).lower()) for v in values)
+
+        # Requests can only be merged when every other parameter, the token, the priority and the retries are the same...
+        # Lookups of more than 100 keys are split across several batches which are sent concurrently, bounded by
+        # FANOUT_LIMIT and the rate limit bucket for the token. Results are merged back in the order requested...
+        ignored: set[str] = {*route.batch, "first", "after"}
+        other: dict[str, Any] = {k: v for k, v in route.params.items() if k not in ignored and v is not None}
+        group: tuple[Any, ...] = (
+            route.path,
+            repr(sorted(other.items())),
+            route.headers.get("Authorization", ""),
+            route.priority,
+            route.retries,
+        )
+
+        loader: BatchLoader[BatchKey, BatchResult] | None = self._loaders.get(group)
+        if loader is None:
+            loader = self._loaders[group] = BatchLoader(self._batch_fetcher(route, other))
+
+            # Loaders are only looked up to join a batch which is still collecting keys, so evicting an old one never
+            # affects lookups already waiting on it...
+            while len(self._loaders) > self.LOADER_LIMIT:
+                self._loaders.popitem(last=False)
+        else:
+            self._loaders.move_to_end(group)
+
+        # The same result can match more than one key, E.g. when looking up a user by both ID and login...
+        items: dict[str, RawResponse] = {}
+        for found in await asyncio.gather(*(loader.load(k) for k in keys)):
+            if isinstance(found, HTTPException):
+                raise found
+
+            for item in found or []:
+                items.setdefault(str(item.get("id", id(item))), item)
+
+        return {"data": list(items.values()), "pagination": {}}
+
+    def _batch_fetcher(
+        self, template: Route, other: dict[str, Any]
+    ) -> Callable[[list[BatchKey]], Awaitable[dict[BatchKey, BatchResult]]]:
+        assert template.batch
+        fields: dict[str, str] = template.batch
+
+        async def send(batch: list[BatchKey]) -> dict[BatchKey, BatchResult]:
+            params: dict[str, Any] = dict(other)
+            for param, value in batch:
+                params.setdefault(param, []).append(value)
+
+            if "first" in template.params:
+                params["first"] = 100
+
+            merged: Route = Route(
+                "GET",
+                template.path,
+                params=params,
+                headers=dict(template.headers),
+                token_for=template.token_for,
+                retries=template.retries,
+                priority=template.priority,
+            )
+
+            async with self._fanout:
+                data: RawResponse = await self.request_json(merged)
+
+            results: dict[BatchKey, BatchResult] = {k: [] for k in batch}
+
+            for item in data["data"]:
+                for param, field in fields.items():
+                    found: BatchResult | None = results.get((param, str(item.get(field, "")).lower()))
+                    if isinstance(found, list):
+                        found.append(item)
+
+            return results
+
+        async def fetch(batch: list[BatchKey]) -> dict[BatchKey, BatchResult]:
+            try:
+                return await send(batch)
+            except HTTPException as e:
+                # Twitch rejects the whole request when any one key is invalid, E.g. a malformed login. So one caller
+                # does not fail every other caller merged into the batch, the batch is split until the failing keys are
+                # found and only those keys fail. Errors which apply to the token or endpoint, and timeouts, fail the
+                # whole batch...
+                if not 400 <= e.status < 500 or e.status in (401, 403, 408, 429) or isinstance(e, HTTPTimeoutException):
+                    raise
+
+                if len(batch) == 1:
+                    return {batch[0]: e}
+
+                logger.debug("Batched request to %r failed with status %d. Splitting the batch.", template, e.status)
+
+                middle: int = len(batch) // 2
+                halves: tuple[list[BatchKey], list[BatchKey]] = (batch[:middle], batch[middle:])
+
+                # Both halves always finish, so an error in one never leaves the other unretrieved, and each error only
+                # reaches the keys of the half it happened in...
+                results: dict[BatchKey, BatchResult] = {}
+                for half, result in zip(halves, await asyncio.gather(*map(fetch, halves), return_exceptions=True)):
+                    if isinstance(result, HTTPException):
+                        results.update(dict.fromkeys(half, result))
+                    elif isinstance(result, BaseException):
+                        raise result
+                    else:
+                        results.update(result)
+
+                return results
+
+        return fetch
+
+    async def _request(self, route: Route) -> RawResponse | str | None:
+        # The ID endpoints (OAuth) are not part of the Helix rate limit...
+        bucket: RateLimitBucket | None = None if route.use_id else self._ratelimiter.get_bucket(self._bucket_key(route))
+        breaker: CircuitBreaker | None = None
+        backoff: Backoff | None = None
+        attempts: int = 0
+        hedge: float | None = self._hedge_delay(route)
+
+        if self.breakers is not None and not route.use_id:
+            breaker = self.breakers.get_breaker(route.method, route.path)
+
+        while True:
+            ticket: int | None = 0
+
+            # Fail fast while the endpoint is failing, before spending a rate limit point...
+            if breaker:
+                ticket = breaker.allow()
+
+            if breaker and ticket is None:
+                raise CircuitOpenException(
+                    f"Request {route} was not sent as the circuit breaker for {route.method} {route.path!r} is open.",
                     route=route,
-                    status=resp.status,
-                    extra=data,
+                    retry_after=breaker.retry_after,
                 )
 
-            if resp.status == 204:
-                return None
+            assert ticket is not None
 
-        return data
+            try:
+                if hedge is not None and self._can_hedge(bucket, breaker):
+                    return await self._send_hedged(route, bucket, breaker, ticket, hedge)
+
+                return await self._send(route, bucket, breaker, ticket)
+            except HTTPException as e:
+                if not self._should_retry(route, e.status, attempts):
+                    raise
+
+                # A 429 leaves the bucket empty with the reset time from Twitch, so acquiring the bucket again will
+                # wait exactly until Ratelimit-Reset. Anything else backs off exponentially...
+                limited: bool = e.status == 429 and bucket is not None and bucket.reset > 0
+                if limited:
+                    assert bucket
+                    delay: float = max(bucket.reset - time.time(), 0.0)
+                else:
+                    backoff = backoff or Backoff(base=1, maximum_time=10, maximum_tries=None)
+                    delay = backoff.calculate()
+
+                deadline: float | None = _deadline.get()
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    raise
+
+                attempts += 1
+                self.retried += 1
+
+                logger.debug(
+                    "Request to %r failed with status %d. Retrying in %.2f seconds (attempt %d of %d).",
+                    route,
+                    e.status,
+                    delay,
+                    attempts,
+                    route.retries,
+                )
+
+                if self.retry_hook:
+                    self.retry_hook(route, e.status, attempts)
+
+                if not limited:
+                    await asyncio.sleep(delay)
 
     async def request_json(self, route: Route) -> Any:
         route.headers.update({"Accept": "application/json"})
@@ -629,9 +1861,9 @@ class HTTPClient:
             params["started_at"] = date_to_datetime_with_z(started_at)
             params["ended_at"] = date_to_datetime_with_z(ended_at)
 
-        route: Route = Route("GET", "analytics/extensions", params=params, token_for=token_for)
+        route: Route = Route("GET", "analytics/extensions", params=params, token_for=token_for, priority=RequestPriority.LOW)
 
-        async def converter(data: ExtensionAnalyticsResponseData, *, raw: Any) -> ExtensionAnalytics:
+        def converter(data: ExtensionAnalyticsResponseData, *, raw: Any) -> ExtensionAnalytics:
             return ExtensionAnalytics(data)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -658,9 +1890,9 @@ class HTTPClient:
             params["started_at"] = date_to_datetime_with_z(started_at)
             params["ended_at"] = date_to_datetime_with_z(ended_at)
 
-        route: Route = Route("GET", "analytics/games", params=params, token_for=token_for)
+        route: Route = Route("GET", "analytics/games", params=params, token_for=token_for, priority=RequestPriority.LOW)
 
-        async def converter(data: GameAnalyticsResponseData, *, raw: Any) -> GameAnalytics:
+        def converter(data: GameAnalyticsResponseData, *, raw: Any) -> GameAnalytics:
             return GameAnalytics(data)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -717,7 +1949,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "extensions/transactions", params=params)
 
-        async def converter(data: ExtensionTransactionsResponseData, *, raw: Any) -> ExtensionTransaction:
+        def converter(data: ExtensionTransactionsResponseData, *, raw: Any) -> ExtensionTransaction:
             return ExtensionTransaction(data, http=self)
 
         iterator: HTTPAsyncIterator[ExtensionTransaction] = self.request_paginated(
@@ -735,8 +1967,9 @@ class HTTPClient:
         token_for: str | PartialUser | None = None,
     ) -> ChannelInformationResponse:
         params = {"broadcaster_id": broadcaster_ids}
+        batch: dict[str, str] = {"broadcaster_id": "broadcaster_id"}
 
-        route: Route = Route("GET", "channels", params=params, token_for=token_for)
+        route: Route = Route("GET", "channels", params=params, token_for=token_for, batch=batch)
         return await self.request_json(route)
 
     async def patch_channel_info(
@@ -814,7 +2047,7 @@ class HTTPClient:
 
         route = Route("GET", "channels/followed", params=params, token_for=token_for)
 
-        async def converter(data: FollowedChannelsResponseData, *, raw: Any) -> FollowedChannelsEvent:
+        def converter(data: FollowedChannelsResponseData, *, raw: Any) -> FollowedChannelsEvent:
             return FollowedChannelsEvent(data, http=self)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -840,7 +2073,7 @@ class HTTPClient:
 
         route = Route("GET", "channels/followers", params=params, token_for=token_for)
 
-        async def converter(data: ChannelFollowersResponseData, *, raw: Any) -> ChannelFollowerEvent:
+        def converter(data: ChannelFollowersResponseData, *, raw: Any) -> ChannelFollowerEvent:
             return ChannelFollowerEvent(data, http=self)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -1015,7 +2248,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "channel_points/custom_rewards/redemptions", params=params, token_for=token_for)
 
-        async def converter(data: CustomRewardRedemptionResponseData, *, raw: Any) -> CustomRewardRedemption:
+        def converter(data: CustomRewardRedemptionResponseData, *, raw: Any) -> CustomRewardRedemption:
             return CustomRewardRedemption(data, parent_reward=parent_reward, http=self)
 
         iterator = self.request_paginated(route, converter=converter)
@@ -1062,7 +2295,7 @@ class HTTPClient:
         params = {"broadcaster_id": broadcaster_id, "first": first}
         route: Route = Route("GET", "charity/donations", params=params, token_for=token_for)
 
-        async def converter(data: CharityCampaignDonationsResponseData, *, raw: Any) -> CharityDonation:
+        def converter(data: CharityCampaignDonationsResponseData, *, raw: Any) -> CharityDonation:
             return CharityDonation(data, http=self)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -1082,7 +2315,7 @@ class HTTPClient:
         params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id, "first": first}
         route: Route = Route("GET", "chat/chatters", params=params, token_for=token_for)
 
-        async def converter(data: ChattersResponseData, *, raw: Any) -> PartialUser:
+        def converter(data: ChattersResponseData, *, raw: Any) -> PartialUser:
             return PartialUser(data["user_id"], data["user_login"], http=self)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -1103,7 +2336,7 @@ class HTTPClient:
     ) -> UserChatColorResponse:
         params: dict[str, list[str | int]] = {"user_id": user_ids}
 
-        route: Route = Route("GET", "chat/color", params=params, token_for=token_for)
+        route: Route = Route("GET", "chat/color", params=params, token_for=token_for, batch={"user_id": "user_id"})
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1170,7 +2403,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "chat/emotes/user", params=params, token_for=token_for)
 
-        async def converter(data: UserEmotesResponseData, *, raw: Any) -> UserEmote:
+        def converter(data: UserEmotesResponseData, *, raw: Any) -> UserEmote:
             return UserEmote(data, template=raw["template"], http=self)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -1263,7 +2496,7 @@ class HTTPClient:
         if reply_to_message_id is not None:
             data["reply_parent_message_id"] = reply_to_message_id
 
-        route: Route = Route("POST", "chat/messages", json=data, token_for=token_for)
+        route: Route = Route("POST", "chat/messages", json=data, token_for=token_for, priority=RequestPriority.HIGH)
         return await self.request_json(route)
 
     async def put_user_chat_color(self, user_id: str | int, color: str, token_for: str) -> None:
@@ -1287,6 +2520,7 @@ class HTTPClient:
         is_featured: bool | None = None,
         token_for: str | PartialUser | None = None,
         max_results: int | None = None,
+        windows: int = 1,
     ) -> HTTPAsyncIterator[Clip]:
         params: dict[str, str | int | list[str]] = {"first": first}
 
@@ -1304,11 +2538,29 @@ class HTTPClient:
         if is_featured is not None:
             params["is_featured"] = is_featured
 
-        route: Route = Route("GET", "clips", params=params, token_for=token_for)
-
-        async def converter(data: ClipsResponseData, *, raw: Any) -> Clip:
+        def converter(data: ClipsResponseData, *, raw: Any) -> Clip:
             return Clip(data, http=self)
 
+        if windows > 1 and started_at and ended_at:
+            # Each window is paginated with its own cursor, so the whole range can be walked concurrently...
+            step: datetime.timedelta = (ended_at - started_at) / windows
+            iterators: list[HTTPAsyncIterator[Any]] = []
+
+            for index in range(windows):
+                window_end: datetime.datetime = ended_at if index == windows - 1 else started_at + step * (index + 1)
+                window: dict[str, str | int | list[str]] = {
+                    **params,
+                    "first": 100,
+                    "started_at": url_encode_datetime(started_at + step * index),
+                    "ended_at": url_encode_datetime(window_end),
+                }
+
+                window_route: Route = Route("GET", "clips", params=window, token_for=token_for)
+                iterators.append(self.request_paginated(window_route, max_results=max_results))
+
+            return HTTPMergedAsyncIterator(self, iterators, max_results, converter=converter)
+
+        route: Route = Route("GET", "clips", params=params, token_for=token_for)
         iterator: HTTPAsyncIterator[Clip] = self.request_paginated(route, converter=converter, max_results=max_results)
         return iterator
 
@@ -1350,7 +2602,7 @@ class HTTPClient:
     #     if status:
     #         params["status"] = status
 
-    #     async def converter(data: ShardData, *, raw: Any) -> Shard:
+    #     def converter(data: ShardData, *, raw: Any) -> Shard:
     #         return Shard(data=data)
 
     #     route: Route = Route("GET", "eventsub/conduits/shards", params=params)
@@ -1402,7 +2654,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "entitlements/drops", params=params, token_for=token_for)
 
-        async def converter(data: DropsEntitlementsResponseData, *, raw: Any) -> Entitlement:
+        def converter(data: DropsEntitlementsResponseData, *, raw: Any) -> Entitlement:
             return Entitlement(data, http=self)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -1497,7 +2749,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "eventsub/subscriptions", params=params, token_for=token_for)
 
-        async def converter(data: EventsubSubscriptionResponseData, *, raw: Any) -> EventsubSubscription:
+        def converter(data: EventsubSubscriptionResponseData, *, raw: Any) -> EventsubSubscription:
             return EventsubSubscription(data, http=self)
 
         iterator: HTTPAsyncIterator[EventsubSubscription] = self.request_paginated(
@@ -1526,7 +2778,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "games/top", params=params, token_for=token_for)
 
-        async def converter(data: TopGamesResponseData, *, raw: Any) -> Game:
+        def converter(data: TopGamesResponseData, *, raw: Any) -> Game:
             return Game(data, http=self)
 
         iterator: HTTPAsyncIterator[Game] = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -1550,7 +2802,8 @@ class HTTPClient:
         if igdb_ids is not None:
             params["igdb_id"] = igdb_ids
 
-        route: Route = Route("GET", "games", params=params, token_for=token_for)
+        batch: dict[str, str] = {"name": "name", "id": "id", "igdb_id": "igdb_id"}
+        route: Route = Route("GET", "games", params=params, token_for=token_for, batch=batch if params else None)
         return await self.request_json(route)
 
     ### Goals ###
@@ -1576,7 +2829,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "hypetrain/events", params=params, token_for=token_for)
 
-        async def converter(data: HypeTrainEventsResponseData, *, raw: Any) -> HypeTrainEvent:
+        def converter(data: HypeTrainEventsResponseData, *, raw: Any) -> HypeTrainEvent:
             return HypeTrainEvent(data, http=self)
 
         iterator: HTTPAsyncIterator[HypeTrainEvent] = self.request_paginated(
@@ -1653,7 +2906,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "moderation/banned", params=params, token_for=token_for)
 
-        async def converter(data: BannedUsersResponseData, *, raw: Any) -> BannedUser:
+        def converter(data: BannedUsersResponseData, *, raw: Any) -> BannedUser:
             return BannedUser(data, http=self)
 
         iterator: HTTPAsyncIterator[BannedUser] = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -1678,7 +2931,9 @@ class HTTPClient:
         if reason is not None:
             data["data"]["reason"] = reason
 
-        route: Route = Route("POST", "moderation/bans", params=params, json=data, token_for=token_for)
+        route: Route = Route(
+            "POST", "moderation/bans", params=params, json=data, token_for=token_for, priority=RequestPriority.HIGH
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1691,7 +2946,7 @@ class HTTPClient:
     ) -> None:
         params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id, "user_id": user_id}
 
-        route: Route = Route("DELETE", "moderation/bans", params=params, token_for=token_for)
+        route: Route = Route("DELETE", "moderation/bans", params=params, token_for=token_for, priority=RequestPriority.HIGH)
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1711,7 +2966,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "moderation/unban_requests", params=params, token_for=token_for)
 
-        async def converter(data: UnbanRequestsResponseData, *, raw: Any) -> UnbanRequest:
+        def converter(data: UnbanRequestsResponseData, *, raw: Any) -> UnbanRequest:
             return UnbanRequest(data, http=self)
 
         iterator: HTTPAsyncIterator[UnbanRequest] = self.request_paginated(
@@ -1755,7 +3010,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "moderation/blocked_terms", params=params, token_for=token_for)
 
-        async def converter(data: BlockedTermsResponseData, *, raw: Any) -> BlockedTerm:
+        def converter(data: BlockedTermsResponseData, *, raw: Any) -> BlockedTerm:
             return BlockedTerm(data, http=self)
 
         iterator: HTTPAsyncIterator[BlockedTerm] = self.request_paginated(
@@ -1803,7 +3058,7 @@ class HTTPClient:
         if message_id is not None:
             params["message_id"] = message_id
 
-        route: Route = Route("DELETE", "moderation/chat", params=params, token_for=token_for)
+        route: Route = Route("DELETE", "moderation/chat", params=params, token_for=token_for, priority=RequestPriority.HIGH)
         return await self.request_json(route)
 
     def get_moderated_channels(
@@ -1817,7 +3072,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "moderation/channels", params=params, token_for=token_for)
 
-        async def converter(data: ModeratedChannelsResponseData, *, raw: Any) -> PartialUser:
+        def converter(data: ModeratedChannelsResponseData, *, raw: Any) -> PartialUser:
             return PartialUser(data["broadcaster_id"], data["broadcaster_login"], http=self)
 
         iterator: HTTPAsyncIterator[PartialUser] = self.request_paginated(
@@ -1841,7 +3096,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "moderation/moderators", params=params, token_for=token_for)
 
-        async def converter(data: ModeratorsResponseData, *, raw: Any) -> PartialUser:
+        def converter(data: ModeratorsResponseData, *, raw: Any) -> PartialUser:
             return PartialUser(data["user_id"], data["user_login"], http=self)
 
         iterator: HTTPAsyncIterator[PartialUser] = self.request_paginated(
@@ -1889,7 +3144,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "channels/vips", params=params, token_for=token_for)
 
-        async def converter(data: ModeratorsResponseData, *, raw: Any) -> PartialUser:
+        def converter(data: ModeratorsResponseData, *, raw: Any) -> PartialUser:
             return PartialUser(data["user_id"], data["user_login"], http=self)
 
         iterator: HTTPAsyncIterator[PartialUser] = self.request_paginated(
@@ -1960,7 +3215,9 @@ class HTTPClient:
         params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id}
         data = {"user_id": user_id, "reason": reason}
 
-        route: Route = Route("POST", "moderation/warnings", params=params, json=data, token_for=token_for)
+        route: Route = Route(
+            "POST", "moderation/warnings", params=params, json=data, token_for=token_for, priority=RequestPriority.HIGH
+        )
         return await self.request_json(route)
 
     ### Polls ###
@@ -1980,7 +3237,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "polls", params=params, token_for=token_for)
 
-        async def converter(data: PollsResponseData, *, raw: Any) -> Poll:
+        def converter(data: PollsResponseData, *, raw: Any) -> Poll:
             return Poll(data, http=self)
 
         iterator: HTTPAsyncIterator[Poll] = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -2044,7 +3301,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "predictions", params=params, token_for=token_for)
 
-        async def converter(data: PredictionsResponseData, *, raw: Any) -> Prediction:
+        def converter(data: PredictionsResponseData, *, raw: Any) -> Prediction:
             return Prediction(data, http=self)
 
         iterator: HTTPAsyncIterator[Prediction] = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -2136,7 +3393,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "schedule", params=params, token_for=token_for)
 
-        async def converter(data: str, *, raw: ChannelStreamScheduleResponse) -> Schedule:
+        def converter(data: str, *, raw: ChannelStreamScheduleResponse) -> Schedule:
             return Schedule(raw["data"], http=self)
 
         iterator: HTTPAsyncIterator[Schedule] = self.request_paginated(
@@ -2258,7 +3515,7 @@ class HTTPClient:
         }
         route: Route = Route("GET", "search/categories", params=params, token_for=token_for)
 
-        async def converter(data: GamesResponseData, *, raw: Any) -> Game:
+        def converter(data: GamesResponseData, *, raw: Any) -> Game:
             return Game(data, http=self)
 
         iterator: HTTPAsyncIterator[Game] = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -2277,7 +3534,7 @@ class HTTPClient:
         params: dict[str, str | int] = {"query": query, "live_only": live, "first": first}
         route: Route = Route("GET", "search/channels", params=params, token_for=token_for)
 
-        async def converter(data: SearchChannelsResponseData, *, raw: Any) -> SearchChannel:
+        def converter(data: SearchChannelsResponseData, *, raw: Any) -> SearchChannel:
             return SearchChannel(data, http=self)
 
         iterator: HTTPAsyncIterator[SearchChannel] = self.request_paginated(
@@ -2315,9 +3572,13 @@ class HTTPClient:
         if languages is not None:
             params["language"] = languages
 
-        route: Route = Route("GET", "streams", params=params, token_for=token_for)
+        # Lookups of specific users return at most one stream each, so they can be merged with other lookups...
+        batchable: bool = bool(user_ids or user_logins) and game_ids is None and languages is None
+        batch: dict[str, str] | None = {"user_id": "user_id", "user_login": "user_login"} if batchable else None
 
-        async def converter(data: StreamsResponseData, *, raw: Any) -> Stream:
+        route: Route = Route("GET", "streams", params=params, token_for=token_for, batch=batch)
+
+        def converter(data: StreamsResponseData, *, raw: Any) -> Stream:
             return Stream(data, http=self)
 
         iterator: HTTPAsyncIterator[Stream] = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -2345,7 +3606,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "streams/followed", params=params, token_for=token_for)
 
-        async def converter(data: StreamsResponseData, *, raw: Any) -> Stream:
+        def converter(data: StreamsResponseData, *, raw: Any) -> Stream:
             return Stream(data, http=self)
 
         iterator: HTTPAsyncIterator[Stream] = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -2385,7 +3646,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "streams/markers", params=params, token_for=token_for)
 
-        async def converter(data: StreamMarkersResponseData, *, raw: Any) -> VideoMarkers:
+        def converter(data: StreamMarkersResponseData, *, raw: Any) -> VideoMarkers:
             return VideoMarkers(data, http=self)
 
         iterator: HTTPAsyncIterator[VideoMarkers] = self.request_paginated(
@@ -2422,7 +3683,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "subscriptions", params=params, token_for=token_for)
 
-        async def converter(data: BroadcasterSubscriptionsResponseData, *, raw: Any) -> BroadcasterSubscription:
+        def converter(data: BroadcasterSubscriptionsResponseData, *, raw: Any) -> BroadcasterSubscription:
             return BroadcasterSubscription(data, http=self)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
@@ -2471,7 +3732,9 @@ class HTTPClient:
         self, ids: list[str | int] | None = None, logins: list[str] | None = None, token_for: str | PartialUser | None = None
     ) -> UsersResponse:
         params = {"id": ids, "login": logins}
-        route: Route = Route("GET", "users", params=params, token_for=token_for)
+        batch: dict[str, str] | None = {"id": "id", "login": "login"} if ids or logins else None
+
+        route: Route = Route("GET", "users", params=params, token_for=token_for, batch=batch)
         return await self.request_json(route)
 
     async def put_user(self, token_for: str, description: str | None) -> UpdateUserResponse:
@@ -2486,7 +3749,7 @@ class HTTPClient:
 
         route: Route = Route("GET", "users/blocks", params=params, token_for=token_for)
 
-        async def converter(data: UserBlockListResponseData, *, raw: Any) -> PartialUser:
+        def converter(data: UserBlockListResponseData, *, raw: Any) -> PartialUser:
             return PartialUser(data["user_id"], data["user_login"], http=self)
 
         iterator: HTTPAsyncIterator[PartialUser] = self.request_paginated(
@@ -2572,7 +3835,7 @@ class HTTPClient:
 
         route = Route("GET", "videos", params=params, token_for=token_for)
 
-        async def converter(data: VideosResponseData, *, raw: Any) -> Video:
+        def converter(data: VideosResponseData, *, raw: Any) -> Video:
             return Video(data, http=self)
 
         iterator = self.request_paginated(route, converter=converter, max_results=max_results)
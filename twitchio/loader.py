@@ -0,0 +1,126 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Generic, TypeAlias, TypeVar
+
+
+__all__ = ("BatchLoader",)
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+BatchFetcher: TypeAlias = Callable[[list[KT]], Awaitable[Mapping[KT, VT]]]
+
+
+class BatchLoader(Generic[KT, VT]):
+    """Collects individual lookups made within a short window and resolves them with a single batched request.
+
+    Each call to :meth:`load` waits up to ``delay`` seconds for other lookups to arrive. The collected keys are then passed
+    to ``fetch`` in one call, and each caller receives the value for their own key. A batch is sent early when it reaches
+    ``max_size`` keys. Identical keys in the same window share one slot in the batch.
+
+    Parameters
+    ----------
+    fetch: Callable[[list[KT]], Awaitable[Mapping[KT, VT]]]
+        The coroutine function used to resolve a batch of keys. Keys missing from the returned mapping resolve to ``None``.
+    delay: float
+        The amount of seconds to wait for more keys before sending a batch. Defaults to ``0.005``.
+    max_size: int
+        The maximum amount of keys to send in a single batch. Defaults to ``100``.
+    """
+
+    __slots__ = ("_delay", "_fetch", "_handle", "_max_size", "_pending", "_tasks")
+
+    def __init__(self, fetch: BatchFetcher[KT, VT], *, delay: float = 0.005, max_size: int = 100) -> None:
+        self._fetch: BatchFetcher[KT, VT] = fetch
+        self._delay: float = delay
+        self._max_size: int = max_size
+
+        self._pending: dict[KT, asyncio.Future[VT | None]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: KT) -> VT | None:
+        future: asyncio.Future[VT | None] | None = self._pending.get(key)
+
+        if future is None:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+
+            if len(self._pending) >= self._max_size:
+                self._dispatch()
+            elif self._handle is None:
+                self._handle = loop.call_later(self._delay, self._dispatch)
+
+        # The future may be shared with other callers who requested the same key...
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        # A batch is shared by every caller in it, so it must not run with the context, E.g. the request deadline, of
+        # whichever caller happened to open it. Each caller applies their own deadline while waiting on their key...
+        task: asyncio.Task[None] = asyncio.create_task(self._run(batch), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[KT, asyncio.Future[VT | None]]) -> None:
+        logger.debug("Sending a batched lookup of %d keys with %s.", len(batch), self.__class__.__qualname__)
+
+        try:
+            results: Mapping[KT, VT] = await self._fetch(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+
+            raise
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+
+                    # Callers which stopped waiting never retrieve the exception, so mark it retrieved here...
+                    future.exception()
+
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
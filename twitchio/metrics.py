@@ -0,0 +1,338 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeAlias
+
+import aiohttp
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import SimpleNamespace
+
+
+__all__ = ("HTTPMetrics", "RequestMetrics", "RouteStats")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class RequestMetrics(NamedTuple):
+    """NamedTuple that represents the measurements of a single HTTP request attempt.
+
+    Only attempts which completed, with a response or an error, are measured. Attempts which were cancelled, E.g. the
+    losing request of a hedged pair or a request cancelled by its deadline, are counted in
+    :attr:`RouteStats.cancelled` instead, so they do not count as errors or affect latency percentiles.
+
+    Attributes
+    ----------
+    method: str
+        The request method used.
+    path: str
+        The route template requested, without the base URL or any query parameters. E.g. ``"users"``.
+    status: int
+        The status code of the response. Could be ``0`` if the request failed before a response was received.
+    bytes: int
+        The size of the response body in bytes.
+    queue_wait: float
+        The amount of seconds the request waited in the rate limit queue before being sent.
+    connect: float
+        The amount of seconds spent opening a new connection. Could be ``0.0`` when a pooled connection was reused, or when
+        the session was not created by TwitchIO.
+    latency: float
+        The total amount of seconds the request took, including ``queue_wait`` and ``connect``.
+    """
+
+    method: str
+    path: str
+    status: int
+    bytes: int
+    queue_wait: float
+    connect: float
+    latency: float
+
+
+RequestHook: TypeAlias = Callable[[RequestMetrics], Any]
+
+
+class RouteStats:
+    """Rolling statistics for a single route template.
+
+    Latencies are kept for the most recent ``window`` requests only, so percentiles follow the current behaviour of the
+    endpoint rather than its whole history. Percentiles are recalculated once about ``1/32`` of the window has been
+    replaced by new requests, so they can trail the most recent requests slightly. Status counts are kept for every
+    request.
+
+    Attributes
+    ----------
+    method: str
+        The request method used.
+    path: str
+        The route template these statistics belong to.
+    count: int
+        The total amount of requests made to this route.
+    errors: int
+        The total amount of requests which failed or received a status of ``400`` or above.
+    cancelled: int
+        The total amount of requests which were cancelled before completing. These are not included in ``count``.
+    statuses: collections.Counter[int]
+        The amount of responses received for each status code.
+    bytes: int
+        The total amount of response bytes received from this route.
+    """
+
+    RESORT_FRACTION: ClassVar[int] = 32
+
+    __slots__ = (
+        "_latencies",
+        "_queue_waits",
+        "_sorted",
+        "bytes",
+        "cancelled",
+        "count",
+        "errors",
+        "method",
+        "path",
+        "statuses",
+    )
+
+    def __init__(self, method: str, path: str, *, window: int = 1024) -> None:
+        self.method: str = method
+        self.path: str = path
+        self.count: int = 0
+        self.errors: int = 0
+        self.cancelled: int = 0
+        self.bytes: int = 0
+        self.statuses: Counter[int] = Counter()
+
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._queue_waits: deque[float] = deque(maxlen=window)
+
+        # A sorted copy of each window, keyed by whether it is the queue wait, and the count it was sorted at...
+        self._sorted: dict[bool, tuple[int, list[float]]] = {}
+
+    def __repr__(self) -> str:
+        return f"RouteStats(method={self.method}, path={self.path}, count={self.count}, p99={self.p99:.3f})"
+
+    def record(self, metrics: RequestMetrics) -> None:
+        self.count += 1
+        self.bytes += metrics.bytes
+        self.statuses[metrics.status] += 1
+
+        if metrics.status == 0 or metrics.status >= 400:
+            self.errors += 1
+
+        self._latencies.append(metrics.latency)
+        self._queue_waits.append(metrics.queue_wait)
+
+    def _ordered(self, queue: bool) -> list[float]:
+        samples: deque[float] = self._queue_waits if queue else self._latencies
+        cached: tuple[int, list[float]] | None = self._sorted.get(queue)
+
+        # Hedged requests read a percentile on every request, so the window is only sorted again once enough of it has
+        # changed. Small windows are sorted on every change, which is cheap...
+        if cached is None or self.count - cached[0] > len(samples) // self.RESORT_FRACTION:
+            cached = self._sorted[queue] = (self.count, sorted(samples))
+
+        return cached[1]
+
+    @staticmethod
+    def _percentile(ordered: list[float], percentile: float) -> float:
+        if not ordered:
+            return 0.0
+
+        index: int = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+
+        return ordered[min(index, len(ordered) - 1)]
+
+    def percentile(self, percentile: float, *, queue: bool = False) -> float:
+        """Return a latency percentile, in seconds, over the rolling window.
+
+        Parameters
+        ----------
+        percentile: float
+            The percentile to calculate, between ``0`` and ``100``. E.g. ``99``.
+        queue: bool
+            Whether to calculate the percentile of the rate limit queue wait instead of the total latency.
+            Defaults to ``False``.
+
+        Returns
+        -------
+        float
+            The latency percentile. Could be ``0.0`` if no requests have been made.
+        """
+        return self._percentile(self._ordered(queue), percentile)
+
+    @property
+    def p50(self) -> float:
+        """Property returning the median latency in seconds over the rolling window."""
+        return self.percentile(50)
+
+    @property
+    def p90(self) -> float:
+        """Property returning the 90th percentile latency in seconds over the rolling window."""
+        return self.percentile(90)
+
+    @property
+    def p99(self) -> float:
+        """Property returning the 99th percentile latency in seconds over the rolling window."""
+        return self.percentile(99)
+
+    @property
+    def error_rate(self) -> float:
+        """Property returning the fraction of all requests to this route which failed."""
+        return self.errors / self.count if self.count else 0.0
+
+
+class HTTPMetrics:
+    """Per-route request statistics and hooks for the HTTP client.
+
+    Each request attempt, including retries, is recorded as a :class:`~twitchio.RequestMetrics` in the
+    :class:`~twitchio.RouteStats` for its method and route template, and passed to every registered hook.
+
+    Parameters
+    ----------
+    window: int
+        The amount of recent requests used to calculate latency percentiles for each route. Defaults to ``1024``.
+
+    Examples
+    --------
+
+    .. code:: python3
+
+        def on_request(metrics: twitchio.RequestMetrics) -> None:
+            if metrics.status >= 500:
+                ...
+
+        client.http_metrics.add_hook(on_request)
+
+        for stats in client.http_metrics:
+            print(stats.method, stats.path, stats.p99, stats.error_rate)
+
+        stats = client.http_metrics.get("GET", "streams")
+    """
+
+    __slots__ = ("_hooks", "_routes", "window")
+
+    def __init__(self, *, window: int = 1024) -> None:
+        self.window: int = max(1, window)
+
+        self._routes: dict[tuple[str, str], RouteStats] = {}
+        self._hooks: list[RequestHook] = []
+
+    def __repr__(self) -> str:
+        return f"HTTPMetrics(routes={len(self._routes)})"
+
+    def __iter__(self) -> Iterator[RouteStats]:
+        return iter(list(self._routes.values()))
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def get(self, method: str, path: str) -> RouteStats | None:
+        """Return the :class:`~twitchio.RouteStats` for a route template, or ``None`` if it has not been requested.
+
+        Parameters
+        ----------
+        method: str
+            The request method. E.g. ``"GET"``.
+        path: str
+            The route template. E.g. ``"channels/followers"``.
+        """
+        return self._routes.get((method.upper(), path.strip("/")))
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Register a callable which is called with a :class:`~twitchio.RequestMetrics` after each request attempt.
+
+        Hooks are called synchronously and should return quickly. Coroutine functions are not awaited.
+
+        Parameters
+        ----------
+        hook: Callable[[RequestMetrics], Any]
+            The callable to register.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Remove a hook previously registered with :meth:`add_hook`. Does nothing if the hook was not registered.
+
+        Parameters
+        ----------
+        hook: Callable[[RequestMetrics], Any]
+            The callable to remove.
+        """
+        try:
+            self._hooks.remove(hook)
+        except ValueError:
+            pass
+
+    def _stats(self, method: str, path: str) -> RouteStats:
+        try:
+            stats: RouteStats = self._routes[(method, path)]
+        except KeyError:
+            stats = self._routes[(method, path)] = RouteStats(method, path, window=self.window)
+
+        return stats
+
+    def record_cancelled(self, method: str, path: str) -> None:
+        # Cancelled attempts are only counted. Hooks are not called as there are no measurements to pass...
+        self._stats(method, path).cancelled += 1
+
+    def record(self, metrics: RequestMetrics) -> None:
+        self._stats(metrics.method, metrics.path).record(metrics)
+
+        for hook in self._hooks:
+            try:
+                hook(metrics)
+            except Exception as e:
+                logger.warning("Ignoring exception in HTTP metrics hook %r: %s", hook, e)
+
+    def clear(self) -> None:
+        """Remove every recorded statistic. Registered hooks are kept."""
+        self._routes.clear()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        # Connection timings are written into the dict passed as trace_request_ctx for each request...
+        async def on_connection_create_start(_: Any, context: SimpleNamespace, __: Any) -> None:
+            timings: dict[str, float] | None = context.trace_request_ctx
+            if timings is not None:
+                timings["connect_start"] = time.perf_counter()
+
+        async def on_connection_create_end(_: Any, context: SimpleNamespace, __: Any) -> None:
+            timings: dict[str, float] | None = context.trace_request_ctx
+            if timings is not None and "connect_start" in timings:
+                timings["connect"] = time.perf_counter() - timings["connect_start"]
+
+        config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        config.on_connection_create_start.append(on_connection_create_start)
+        config.on_connection_create_end.append(on_connection_create_end)
+
+        return config
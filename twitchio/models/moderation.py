@@ -24,7 +24,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, NamedTuple
 
 from twitchio.user import PartialUser
 from twitchio.utils import parse_timestamp
@@ -33,6 +33,9 @@ from twitchio.utils import parse_timestamp
 if TYPE_CHECKING:
     import datetime
 
+    import aiohttp
+
+    from twitchio.exceptions import HTTPException
     from twitchio.http import HTTPClient
     from twitchio.types_.responses import (
         AutomodSettingsResponseData,
@@ -53,6 +56,7 @@ __all__ = (
     "Ban",
     "BannedUser",
     "BlockedTerm",
+    "ModerationResult",
     "ShieldModeStatus",
     "Timeout",
     "UnbanRequest",
@@ -289,6 +293,31 @@ class Timeout:
         return f"<Timeout broadcaster={self.broadcaster} user={self.user} created_at={self.created_at} end_time={self.end_time}>"
 
 
+class ModerationResult(NamedTuple):
+    """NamedTuple that represents the outcome of a single action in a bulk moderation request.
+
+    Attributes
+    ----------
+    target: str
+        The ID of the user, or message, the action was taken against.
+    result: Ban | Timeout | None
+        The :class:`~twitchio.Ban` or :class:`~twitchio.Timeout` created by the action. Always ``None`` when the action
+        failed, or when deleting messages.
+    error: HTTPException | aiohttp.ClientError | TimeoutError | None
+        The exception raised for this target if the action failed, otherwise ``None``. Either an
+        :exc:`~twitchio.HTTPException`, or a connection error or timeout raised while sending the request.
+    """
+
+    target: str
+    result: Ban | Timeout | None
+    error: HTTPException | aiohttp.ClientError | TimeoutError | None
+
+    @property
+    def ok(self) -> bool:
+        """Property returning whether the action succeeded."""
+        return self.error is None
+
+
 class UnbanRequest:
     """Represents an unban request.
 
@@ -25,8 +25,10 @@ SOFTWARE.
 from collections.abc import Callable, Coroutine
 from typing import Any
 
+from .breaker import CircuitBreaker, CircuitState
 
-__all__ = ("EventErrorPayload",)
+
+__all__ = ("CircuitBreakerPayload", "EventErrorPayload")
 
 
 class EventErrorPayload:
@@ -49,3 +51,25 @@ class EventErrorPayload:
         self.error: Exception = error
         self.listener: Callable[..., Coroutine[Any, Any, None]] = listener
         self.original: Any = original
+
+
+class CircuitBreakerPayload:
+    """Payload received in the :func:`~twitchio.event_circuit_breaker` event when the circuit breaker for a route changes
+    state.
+
+    Attributes
+    ----------
+    breaker: :class:`~twitchio.CircuitBreaker`
+        The circuit breaker which changed state.
+    previous: :class:`~twitchio.CircuitState`
+        The state of the breaker before the change.
+    state: :class:`~twitchio.CircuitState`
+        The new state of the breaker.
+    """
+
+    __slots__ = ("breaker", "previous", "state")
+
+    def __init__(self, *, breaker: CircuitBreaker, previous: CircuitState) -> None:
+        self.breaker: CircuitBreaker = breaker
+        self.previous: CircuitState = previous
+        self.state: CircuitState = breaker.state
@@ -0,0 +1,246 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import heapq
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, ClassVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+__all__ = ("RateLimitBucket", "RateLimiter", "RequestPriority")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+# Twitch's documented default for the Helix token bucket. This is only used until the first response teaches us the real
+# values via the Ratelimit-* headers...
+DEFAULT_LIMIT: int = 800
+
+
+class RequestPriority(enum.IntEnum):
+    """The priority class of a request, used to order requests waiting on a :class:`RateLimitBucket`.
+
+    Attributes
+    ----------
+    LOW
+        Background work, such as later pages of large paginations and analytics exports. These requests never use the
+        points the bucket keeps in reserve for higher priorities.
+    NORMAL
+        The default for most requests.
+    HIGH
+        Interactive and moderation requests, such as sending chat messages, bans and deleting messages.
+    """
+
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+
+
+class RateLimitBucket:
+    """A token bucket which mirrors the Helix rate limit for a single token.
+
+    The bucket starts with the default Twitch limit and learns the real ``limit``, ``remaining`` and ``reset`` values from
+    the ``Ratelimit-Limit``, ``Ratelimit-Remaining`` and ``Ratelimit-Reset`` headers returned with each response.
+
+    When the bucket is empty, requests are queued until the bucket refills. Queued requests are sent in order of their
+    :class:`RequestPriority`, then in the order they arrived. Requests with :attr:`RequestPriority.LOW` are also queued
+    once the bucket falls to its ``reserve``, so background work can not use up the points needed by interactive requests.
+
+    Attributes
+    ----------
+    key: str
+        The key which identifies this bucket. Usually the User-ID the token belongs to, or ``"app"`` for the app token.
+    limit: int
+        The maximum amount of points available in the bucket.
+    remaining: int
+        The amount of points which can currently be spent without waiting.
+    reset: float
+        The UNIX timestamp at which the bucket will be refilled. Could be ``0.0`` when the reset time is not known yet.
+    inflight: int
+        The amount of requests which have taken a point from this bucket and not yet received a response.
+    """
+
+    RESERVE_RATIO: ClassVar[float] = 0.1
+
+    __slots__ = ("_counter", "_drainer", "_waiters", "_wake", "inflight", "key", "limit", "remaining", "reset")
+
+    def __init__(self, key: str, *, limit: int = DEFAULT_LIMIT) -> None:
+        self.key: str = key
+        self.limit: int = limit
+        self.remaining: int = limit
+        self.reset: float = 0.0
+        self.inflight: int = 0
+
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter: itertools.count[int] = itertools.count()
+        self._drainer: asyncio.Task[None] | None = None
+        self._wake: asyncio.Event = asyncio.Event()
+
+    def __repr__(self) -> str:
+        return f"RateLimitBucket(limit={self.limit}, remaining={self.remaining}, reset={self.reset})"
+
+    @property
+    def reserve(self) -> int:
+        """Property returning the amount of points which are only available to requests above
+        :attr:`RequestPriority.LOW`.
+        """
+        return int(self.limit * self.RESERVE_RATIO)
+
+    @property
+    def queued(self) -> int:
+        """Property returning the amount of requests currently waiting on this bucket."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _refill(self, now: float) -> None:
+        if self.reset and now >= self.reset:
+            self.remaining = max(self.limit - self.inflight, 0)
+            self.reset = 0.0
+
+    def _available(self, priority: int) -> bool:
+        return self.remaining > (self.reserve if priority <= RequestPriority.LOW else 0)
+
+    def _take(self) -> None:
+        self.remaining -= 1
+        self.inflight += 1
+
+    def _prune(self) -> None:
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+
+    async def acquire(self, priority: int = RequestPriority.NORMAL) -> None:
+        self._refill(time.time())
+        self._prune()
+
+        # Only skip the queue when nobody of the same or a higher priority is already waiting...
+        if self._available(priority) and (not self._waiters or -self._waiters[0][0] < priority):
+            self._take()
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A point may have been handed to us just before we were cancelled, so give it back...
+            if future.done() and not future.cancelled():
+                self.remaining += 1
+                self.inflight = max(self.inflight - 1, 0)
+                self._wake.set()
+            else:
+                future.cancel()
+
+            raise
+
+    async def _drain(self) -> None:
+        while True:
+            now: float = time.time()
+            self._refill(now)
+            self._prune()
+
+            if not self._waiters:
+                return
+
+            priority: int = -self._waiters[0][0]
+            if self._available(priority):
+                *_, future = heapq.heappop(self._waiters)
+                self._take()
+                future.set_result(None)
+                continue
+
+            # If we don't know when the bucket resets we wait a short time for an in-flight response to tell us...
+            delay: float = self.reset - now if self.reset else 1.0
+            logger.debug("Rate limit bucket is empty. Waiting up to %.2f seconds for it to refill.", delay)
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=max(delay, 0.0))
+            except TimeoutError:
+                pass
+
+    @staticmethod
+    def _parse_headers(headers: Mapping[str, str] | None) -> tuple[int, int, float] | None:
+        if headers is None:
+            return None
+
+        try:
+            return int(headers["Ratelimit-Limit"]), int(headers["Ratelimit-Remaining"]), float(headers["Ratelimit-Reset"])
+        except (KeyError, ValueError):
+            return None
+
+    def release(self, headers: Mapping[str, str] | None = None) -> None:
+        self.inflight = max(self.inflight - 1, 0)
+
+        parsed: tuple[int, int, float] | None = self._parse_headers(headers)
+        if parsed is None:
+            # Without a response, E.g. after a connection error, timeout or cancellation, nothing will tell us when the
+            # point is refilled. Give it back so the bucket can not drain to empty with no reset time to wait for...
+            self.remaining = min(self.remaining + 1, self.limit)
+            self._wake.set()
+            return
+
+        # Requests still in-flight may or may not have been counted by Twitch yet, so we assume the worst...
+        limit, remaining, reset = parsed
+        self.limit = limit
+        self.remaining = max(remaining - self.inflight, 0)
+        self.reset = reset
+
+        # Queued requests may be able to go now that we know the real state of the bucket...
+        self._wake.set()
+
+
+class RateLimiter:
+    """A collection of :class:`RateLimitBucket`, one for each token used to make requests."""
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, RateLimitBucket] = {}
+
+    def get_bucket(self, key: str) -> RateLimitBucket:
+        try:
+            bucket: RateLimitBucket = self._buckets[key]
+        except KeyError:
+            bucket = self._buckets[key] = RateLimitBucket(key)
+
+        return bucket
+
+    def remove_bucket(self, key: str) -> RateLimitBucket | None:
+        return self._buckets.pop(key, None)
+
+    def clear(self) -> None:
+        self._buckets.clear()
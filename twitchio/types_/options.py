@@ -24,18 +24,55 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Collection, Coroutine
 from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
 
 
 if TYPE_CHECKING:
     import aiohttp
 
-    from ..authentication import Scopes
+    from ..authentication import Scopes, TokenStore
+    from ..cache import ResponseCache
     from ..web.utils import BaseAdapter
 
 
-__all__ = ("ClientOptions", "WaitPredicateT")
+__all__ = (
+    "CircuitBreakerPolicy",
+    "ClientOptions",
+    "ConnectionPolicy",
+    "HedgePolicy",
+    "TokenValidationPolicy",
+    "WaitPredicateT",
+)
+
+
+class ConnectionPolicy(TypedDict, total=False):
+    limit: int
+    limit_per_host: int
+    keepalive_timeout: float
+    ttl_dns_cache: int | None
+    prewarm: int
+
+
+class CircuitBreakerPolicy(TypedDict, total=False):
+    error_rate: float
+    minimum_requests: int
+    window: float
+    cooldown: float
+
+
+class HedgePolicy(TypedDict, total=False):
+    delay: float | None
+    percentile: float
+    minimum_samples: int
+    minimum_delay: float
+    routes: Collection[str] | None
+
+
+class TokenValidationPolicy(TypedDict, total=False):
+    concurrency: int
+    fast_start: bool
+    progress: Callable[[str, int, int], Any] | None
 
 
 class ClientOptions(TypedDict, total=False):
@@ -44,6 +81,13 @@ class ClientOptions(TypedDict, total=False):
     session: aiohttp.ClientSession | None
     adapter: NotRequired[BaseAdapter]
     fetch_client_user: NotRequired[bool]
+    response_cache: NotRequired[ResponseCache | None]
+    connection_policy: NotRequired[ConnectionPolicy]
+    request_timeout: NotRequired[float | None]
+    circuit_breaker: NotRequired[CircuitBreakerPolicy | None]
+    hedging: NotRequired[HedgePolicy | None]
+    token_validation: NotRequired[TokenValidationPolicy]
+    token_store: NotRequired[TokenStore | None]
 
 
 WaitPredicateT = Callable[..., Coroutine[Any, Any, bool]]
@@ -28,7 +28,7 @@ from typing import Any, Literal, TypeAlias, TypedDict
 from ..user import PartialUser
 
 
-__all__ = ("APIRequest", "APIRequestKwargs", "HTTPMethod", "ParamMapping")
+__all__ = ("APIRequest", "APIRequestKwargs", "HTTPMethod", "PaginationCheckpoint", "ParamMapping")
 
 
 HTTPMethod: TypeAlias = Literal["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD", "CONNECT", "TRACE"]
@@ -47,3 +47,9 @@ class APIRequest(TypedDict, total=False):
     headers: dict[str, str]
     data: dict[str, Any]
     json: Any
+
+
+class PaginationCheckpoint(TypedDict):
+    path: str
+    cursor: str | bool | None
+    max_results: int | None
@@ -22,7 +22,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import TypeAlias, TypedDict
+from typing import NotRequired, TypeAlias, TypedDict
 
 
 __all__ = ("TokenMapping", "TokenMappingData")
@@ -33,6 +33,7 @@ class TokenMappingData(TypedDict):
     token: str
     refresh: str
     last_validated: str
+    expires_at: NotRequired[str | None]
 
 
 TokenMapping: TypeAlias = dict[str, TokenMappingData]
@@ -35,8 +35,10 @@ from .utils import Colour, parse_timestamp
 
 if TYPE_CHECKING:
     import datetime
+    from collections.abc import Awaitable, Callable
 
     from twitchio.types_.responses import (
+        BanUserResponse,
         UserActiveExtensionsResponseData,
         UserExtensionsResponseData,
         UserPanelComponentItem,
@@ -45,7 +47,7 @@ if TYPE_CHECKING:
         UsersResponseData,
     )
 
-    from .http import HTTPAsyncIterator, HTTPClient
+    from .http import FanOutError, HTTPAsyncIterator, HTTPClient
     from .models.analytics import ExtensionAnalytics, GameAnalytics
     from .models.bits import BitsLeaderboard
     from .models.channel_points import CustomReward
@@ -63,6 +65,7 @@ if TYPE_CHECKING:
         Ban,
         BannedUser,
         BlockedTerm,
+        ModerationResult,
         ShieldModeStatus,
         Timeout,
         UnbanRequest,
@@ -1288,6 +1291,7 @@ class PartialUser:
         token_for: str | PartialUser | None = None,
         first: int = 20,
         max_results: int | None = None,
+        windows: int = 1,
     ) -> HTTPAsyncIterator[Clip]:
         """|aiter|
 
@@ -1312,12 +1316,25 @@ class PartialUser:
             Min is 1 and Max is 100.
         max_results: int | None
             Maximum number of total results to return. When this is set to None (default), then everything found is returned.
+        windows: int
+            The amount of equal time windows to split the range between ``started_at`` and ``ended_at`` into. Each window is
+            paginated concurrently, within the rate limit of the token, and clips are yielded in the order pages arrive
+            rather than in order of time. Clips found in more than one window are only returned once. Both ``started_at``
+            and ``ended_at`` are required when this is above ``1``. Defaults to ``1``.
 
         Returns
         --------
         HTTPAsyncIterator[Clip]
+
+        Raises
+        ------
+        ValueError
+            ``started_at`` and ``ended_at`` must be provided when ``windows`` is above ``1``.
         """
 
+        if windows > 1 and not (started_at and ended_at):
+            raise ValueError("Both 'started_at' and 'ended_at' must be provided when 'windows' is above 1.")
+
         first = max(1, min(100, first))
 
         return self._http.get_clips(
@@ -1328,6 +1345,7 @@ class PartialUser:
             is_featured=featured,
             token_for=token_for,
             max_results=max_results,
+            windows=windows,
         )
 
     async def fetch_goals(self) -> list[Goal]:
@@ -2021,6 +2039,156 @@ class PartialUser:
         )
         return Timeout(data["data"][0], http=self._http)
 
+    async def ban_users(
+        self,
+        *,
+        moderator: str | PartialUser | None = None,
+        users: list[str | PartialUser],
+        reason: str | None = None,
+        concurrency: int = 10,
+    ) -> list[ModerationResult]:
+        """|coro|
+
+        Ban multiple users from the channel tied with this :class:`~twitchio.PartialUser`.
+
+        Bans are sent concurrently, up to ``concurrency`` at a time, and are queued behind the rate limit of the moderator's
+        token. A failed ban does not stop the remaining bans, instead each user receives their own
+        :class:`~twitchio.ModerationResult`.
+
+        .. note::
+
+            Requires a user access token that includes the ``moderator:manage:banned_users`` scope.
+
+        Parameters
+        ----------
+        moderator: str | PartialUser | None
+            An optional ID of or the :class:`~twitchio.PartialUser` object of the moderator issuing this action.
+            You must have a token stored with the ``moderator:manage:banned_users`` scope for this moderator.
+
+            If ``None``, the ID of this :class:`~twitchio.PartialUser` will be used.
+        users: list[str | PartialUser]
+            The IDs of, or the :class:`~twitchio.PartialUser` of the users to ban. Duplicate users are only banned once.
+        reason: str | None
+            An optional reason these chatters are being banned. If provided the length of the reason must not be more than
+            ``500`` characters long. Defaults to ``None``.
+        concurrency: int
+            The maximum amount of ban requests in flight at once. Defaults to ``10``.
+
+        Raises
+        ------
+        ValueError
+            The length of the reason parameter exceeds 500 characters.
+
+        Returns
+        -------
+        list[ModerationResult]
+            A :class:`~twitchio.ModerationResult` for each user, in the order the users were provided.
+        """
+        from .models import Ban, ModerationResult  # fixes: circular import
+
+        if reason and len(reason) > 500:
+            raise ValueError("The provided reason exceeds the allowed length of 500 characters.")
+
+        targets: list[str] = list(dict.fromkeys(str(u.id if isinstance(u, PartialUser) else u) for u in users))
+
+        def ban(user_id: str) -> Callable[[], Awaitable[BanUserResponse]]:
+            return lambda: self._http.post_ban_user(
+                broadcaster_id=self.id,
+                moderator_id=moderator or self.id,
+                user_id=user_id,
+                token_for=moderator,
+                reason=reason,
+            )
+
+        results: list[BanUserResponse | FanOutError] = await self._http.fan_out(
+            [ban(t) for t in targets], concurrency=concurrency
+        )
+
+        return [
+            ModerationResult(t, None, r)
+            if isinstance(r, Exception)
+            else ModerationResult(t, Ban(r["data"][0], http=self._http), None)
+            for t, r in zip(targets, results)
+        ]
+
+    async def timeout_users(
+        self,
+        *,
+        moderator: str | int | PartialUser | None = None,
+        users: list[str | PartialUser],
+        duration: int,
+        reason: str | None = None,
+        concurrency: int = 10,
+    ) -> list[ModerationResult]:
+        """|coro|
+
+        Timeout multiple users from the channel tied with this :class:`~twitchio.PartialUser`.
+
+        Timeouts are sent concurrently, up to ``concurrency`` at a time, and are queued behind the rate limit of the
+        moderator's token. A failed timeout does not stop the remaining timeouts, instead each user receives their own
+        :class:`~twitchio.ModerationResult`.
+
+        .. note::
+
+            Requires a user access token that includes the ``moderator:manage:banned_users`` scope.
+
+        Parameters
+        ----------
+        moderator: str | PartialUser | None
+            An optional ID of or the :class:`~twitchio.PartialUser` object of the moderator issuing this action.
+            You must have a token stored with the ``moderator:manage:banned_users`` scope for this moderator.
+
+            If ``None``, the ID of this :class:`~twitchio.PartialUser` will be used.
+        users: list[str | PartialUser]
+            The IDs of, or the :class:`~twitchio.PartialUser` of the users to timeout. Duplicate users are only timed out
+            once.
+        duration: int
+            The duration of the timeout in seconds. The minimum duration is ``1`` second and the
+            maximum is ``1_209_600`` seconds (2 weeks).
+        reason: str | None
+            An optional reason these chatters are being timed out. If provided the length of the reason must not be more
+            than ``500`` characters long. Defaults to ``None``.
+        concurrency: int
+            The maximum amount of timeout requests in flight at once. Defaults to ``10``.
+
+        Raises
+        ------
+        ValueError
+            The length of the reason parameter exceeds 500 characters.
+
+        Returns
+        -------
+        list[ModerationResult]
+            A :class:`~twitchio.ModerationResult` for each user, in the order the users were provided.
+        """
+        from .models import ModerationResult, Timeout
+
+        if reason and len(reason) > 500:
+            raise ValueError("The provided reason exceeds the allowed length of 500 characters.")
+
+        targets: list[str] = list(dict.fromkeys(str(u.id if isinstance(u, PartialUser) else u) for u in users))
+
+        def timeout(user_id: str) -> Callable[[], Awaitable[BanUserResponse]]:
+            return lambda: self._http.post_ban_user(
+                broadcaster_id=self.id,
+                moderator_id=moderator or self.id,
+                user_id=user_id,
+                token_for=moderator,
+                duration=duration,
+                reason=reason,
+            )
+
+        results: list[BanUserResponse | FanOutError] = await self._http.fan_out(
+            [timeout(t) for t in targets], concurrency=concurrency
+        )
+
+        return [
+            ModerationResult(t, None, r)
+            if isinstance(r, Exception)
+            else ModerationResult(t, Timeout(r["data"][0], http=self._http), None)
+            for t, r in zip(targets, results)
+        ]
+
     async def unban_user(
         self,
         *,
@@ -2338,6 +2506,60 @@ class PartialUser:
             message_id=message_id,
         )
 
+    async def delete_chat_messages_bulk(
+        self,
+        *,
+        moderator: str | int | PartialUser,
+        token_for: str | PartialUser,
+        message_ids: list[str],
+        concurrency: int = 10,
+    ) -> list[ModerationResult]:
+        """|coro|
+
+        Removes multiple chat messages from the broadcaster's chat room.
+
+        Deletions are sent concurrently, up to ``concurrency`` at a time, and are queued behind the rate limit of the token.
+        A failed deletion does not stop the remaining deletions, instead each message receives its own
+        :class:`~twitchio.ModerationResult`.
+
+        See: :meth:`~twitchio.PartialUser.delete_chat_messages` for the restrictions on which messages can be removed.
+
+        .. note::
+           Requires a user access token that includes the ``moderator:manage:chat_messages`` scope.
+
+        Parameters
+        ----------
+        moderator: str | int | PartialUser
+            The ID, or PartialUser, of the broadcaster or a user that has permission to moderate the broadcaster's chat room.
+            This ID must match the user ID in the user access token.
+        token_for: str | PartialUser
+            User access token that includes the ``moderator:manage:chat_messages`` scope.
+        message_ids: list[str]
+            The IDs of the messages to remove. Duplicate IDs are only removed once.
+        concurrency: int
+            The maximum amount of delete requests in flight at once. Defaults to ``10``.
+
+        Returns
+        -------
+        list[ModerationResult]
+            A :class:`~twitchio.ModerationResult` for each message, in the order the IDs were provided.
+        """
+        from .models import ModerationResult
+
+        targets: list[str] = list(dict.fromkeys(message_ids))
+
+        def delete(message_id: str) -> Callable[[], Awaitable[None]]:
+            return lambda: self._http.delete_chat_message(
+                broadcaster_id=self.id,
+                moderator_id=moderator,
+                token_for=token_for,
+                message_id=message_id,
+            )
+
+        results: list[FanOutError | None] = await self._http.fan_out([delete(t) for t in targets], concurrency=concurrency)
+
+        return [ModerationResult(t, None, r) for t, r in zip(targets, results)]
+
     def fetch_moderated_channels(self, *, first: int = 20, max_results: int | None = None) -> HTTPAsyncIterator[PartialUser]:
         """|aiter|
 
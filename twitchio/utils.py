@@ -49,12 +49,84 @@ if TYPE_CHECKING:
     from .types_.options import WaitPredicateT
 
 
+# Both directions work on bytes, so response bodies and webhook payloads are never decoded to str before parsing,
+# and request bodies are never re-encoded after serializing. The codec can be replaced with set_json_codec...
 try:
     import orjson  # type: ignore
 
-    _from_json = orjson.loads  # type: ignore
+    _loads: Callable[[bytes | str], Any] = orjson.loads  # type: ignore
+    _dumps: Callable[[Any], bytes] = orjson.dumps  # type: ignore
+    _json_backend: str = "orjson"
 except ImportError:
-    _from_json = json.loads
+    try:
+        import msgspec  # type: ignore
+
+        _loads = msgspec.json.decode  # type: ignore
+        _dumps = msgspec.json.encode  # type: ignore
+        _json_backend = "msgspec"
+    except ImportError:
+        _loads = json.loads
+
+        def _dumps(obj: Any, /) -> bytes:
+            return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+        _json_backend = "json"
+
+
+def _from_json(data: bytes | str, /) -> Any:
+    # Looked up on each call, as other modules import this function directly...
+    return _loads(data)
+
+
+def _to_json(obj: Any, /) -> bytes:
+    return _dumps(obj)
+
+
+def set_json_codec(loads: Callable[[bytes | str], Any], dumps: Callable[[Any], bytes], *, name: str = "custom") -> None:
+    """A helper function to replace the JSON codec used by TwitchIO.
+
+    The codec is used to parse and serialize HTTP request and response bodies, EventSub websocket messages and webhook
+    payloads, and the default token file. By default ``orjson`` is used if it is installed, then ``msgspec``, and finally
+    the :mod:`json` module.
+
+    This should be called before the :class:`~twitchio.Client` is started.
+
+    Parameters
+    ----------
+    loads: Callable[[bytes | str], Any]
+        A callable which parses JSON from either :class:`bytes` or :class:`str`.
+    dumps: Callable[[Any], bytes]
+        A callable which serializes an object to JSON encoded as UTF-8 :class:`bytes`.
+    name: str
+        An optional name for the codec, returned by :func:`json_backend`. Defaults to ``"custom"``.
+
+    Examples
+    --------
+
+    .. code-block:: python3
+
+        import rapidjson
+
+        import twitchio
+
+
+        twitchio.utils.set_json_codec(rapidjson.loads, lambda obj: rapidjson.dumps(obj).encode("utf-8"), name="rapidjson")
+    """
+    global _loads, _dumps, _json_backend
+
+    _loads, _dumps, _json_backend = loads, dumps, name
+
+
+def json_backend() -> str:
+    """A helper function which returns the name of the JSON codec in use.
+
+    Returns
+    -------
+    str
+        ``"orjson"``, ``"msgspec"`` or ``"json"`` for the codec chosen automatically, or the name passed to
+        :func:`set_json_codec`.
+    """
+    return _json_backend
 
 
 PY_312 = sys.version_info >= (3, 12)
@@ -66,9 +138,12 @@ __all__ = (
     "ColourFormatter",
     "_from_json",
     "_is_submodule",
+    "_to_json",
     "date_to_datetime_with_z",
     "handle_user_ids",
+    "json_backend",
     "parse_timestamp",
+    "set_json_codec",
     "setup_logging",
     "url_encode_datetime",
 )